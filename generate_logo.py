@@ -1,4 +1,5 @@
 from PIL import Image, ImageDraw, ImageFont
+import json
 import os
 
 # Paths
@@ -33,23 +34,44 @@ font_paths = [
     "/Library/Fonts/NanumGothic.ttf",
 ]
 
+# Font validated on a previous run, to skip the probe loop
+FONT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".font_cache.json")
+
 font_path = None
 font_index = 0 # for ttc
 
-for p in font_paths:
-    if os.path.exists(p):
+try:
+    with open(FONT_CACHE_PATH, "r", encoding="utf-8") as f:
+        cached_font = json.load(f)
+    if os.path.exists(cached_font.get("font_path", "")):
+        font_path = cached_font["font_path"]
+        font_index = cached_font.get("font_index", 0)
+        print(f"Using cached font: {font_path}")
+except Exception:
+    pass
+
+if not font_path:
+    for p in font_paths:
+        if os.path.exists(p):
+            try:
+                 # Try loading slightly to test
+                if p.endswith(".ttc"):
+                    ImageFont.truetype(p, 10, index=1)
+                    font_index = 1
+                else:
+                    ImageFont.truetype(p, 10)
+                font_path = p
+                print(f"Found valid font: {p}")
+                break
+            except Exception as e:
+                print(f"Skipping {p}: {e}")
+
+    if font_path:
         try:
-             # Try loading slightly to test
-            if p.endswith(".ttc"):
-                ImageFont.truetype(p, 10, index=1)
-                font_index = 1
-            else:
-                ImageFont.truetype(p, 10)
-            font_path = p
-            print(f"Found valid font: {p}")
-            break
+            with open(FONT_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump({"font_path": font_path, "font_index": font_index}, f)
         except Exception as e:
-            print(f"Skipping {p}: {e}")
+            print(f"Could not cache font choice: {e}")
 
 if not font_path:
     print("Error: No Korean font found.")
@@ -72,21 +94,18 @@ if font_path.endswith(".ttc"):
 else:
      font = ImageFont.truetype(font_path, font_size)
 
-# Calculate exact text size
-dummy_draw = ImageDraw.Draw(Image.new("RGBA", (1,1)))
-
-line_heights = []
-line_widths = []
-for line in LINES:
-    lb = dummy_draw.textbbox((0, 0), line, font=font)
-    line_widths.append(lb[2] - lb[0])
-    line_heights.append(lb[3] - lb[1])
+# Calculate text size from font metrics: line height is fixed per font
+# (ascent + descent) and getlength() shapes each line once, instead of a
+# full textbbox layout per line.
+def line_height_of(f):
+    ascent, descent = f.getmetrics()
+    return ascent + descent
 
 # Spacing
 line_spacing = int(font_size * 0.2)
 # Correction: Vertical text block should NOT include the "since 2016" in the "Height match" constraint?
 # User said "3 lines text height match logo height". "Since 2016" is separate "below".
-total_text_height = sum(line_heights) + (len(LINES) - 1) * line_spacing
+total_text_height = len(LINES) * line_height_of(font) + (len(LINES) - 1) * line_spacing
 
 # Re-scale factor
 # We want total_text_height == H_logo
@@ -99,15 +118,11 @@ else:
      font = ImageFont.truetype(font_path, new_font_size)
 
 # Recalculate measurements with new font
-line_heights = []
-line_widths = []
-for line in LINES:
-    lb = dummy_draw.textbbox((0, 0), line, font=font)
-    line_widths.append(lb[2] - lb[0])
-    line_heights.append(lb[3] - lb[1])
-    
+line_height = line_height_of(font)
+line_widths = [int(round(font.getlength(line))) for line in LINES]
+
 line_spacing = int(new_font_size * 0.2)
-text_block_height = sum(line_heights) + (line_spacing * (len(LINES) - 1))
+text_block_height = len(LINES) * line_height + (line_spacing * (len(LINES) - 1))
 
 # Since 2016
 since_font_size = int(new_font_size * 0.45)
@@ -115,22 +130,24 @@ if font_path.endswith(".ttc"):
      since_font = ImageFont.truetype(font_path, since_font_size, index=font_index)
 else:
      since_font = ImageFont.truetype(font_path, since_font_size)
-since_bbox = dummy_draw.textbbox((0, 0), SINCE_TEXT, font=since_font)
-since_w = since_bbox[2] - since_bbox[0]
-since_h = since_bbox[3] - since_bbox[1]
+since_w = int(round(since_font.getlength(SINCE_TEXT)))
+since_h = line_height_of(since_font)
 
 # Canvas
+# Size the canvas to the final layout up front (5px margin on each side),
+# so the composite is drawn once with no bbox scan, crop or second copy.
+margin = 5
 padding_x = int(new_font_size * 0.4)
 max_text_w = max(line_widths)
-total_w = W_logo + padding_x + max(max_text_w, since_w) + 20
-total_h = max(H_logo, text_block_height + since_h + 10) 
+content_w = W_logo + padding_x + max(max_text_w, since_w)
+content_h = max(H_logo, text_block_height + int(line_spacing/2) + since_h)
 
-canvas = Image.new("RGBA", (total_w, total_h + 50), (255, 255, 255, 255))
+canvas = Image.new("RGBA", (content_w + 2 * margin, content_h + 2 * margin), (255, 255, 255, 255))
 draw = ImageDraw.Draw(canvas)
 
 # Paste Logo
-y_offset = 20
-x_offset = 10
+y_offset = margin
+x_offset = margin
 canvas.paste(logo, (x_offset, y_offset))
 
 # Draw Text
@@ -140,39 +157,27 @@ text_y = y_offset
 # Line 1
 line1_parts = ["VR-AR-AI-XR", "기술과"]
 current_x = text_x
-l1_bbox = draw.textbbox((current_x, text_y), line1_parts[0], font=font)
 draw.text((current_x, text_y), line1_parts[0], font=font, fill=COLOR_LIME)
-current_x += (l1_bbox[2] - l1_bbox[0])
+current_x += font.getlength(line1_parts[0])
 draw.text((current_x, text_y), line1_parts[1], font=font, fill=COLOR_GRAY)
 
 # Line 2
-current_y = text_y + line_heights[0] + line_spacing
+current_y = text_y + line_height + line_spacing
 draw.text((text_x, current_y), LINES[1], font=font, fill=COLOR_GRAY)
 
 # Line 3
 line3_parts = ["성장나눔", " 커뮤니티"]
-current_y += line_heights[1] + line_spacing
+current_y += line_height + line_spacing
 current_x = text_x
-l3_bbox = draw.textbbox((current_x, current_y), line3_parts[0], font=font)
 draw.text((current_x, current_y), line3_parts[0], font=font, fill=COLOR_LIME)
-current_x += (l3_bbox[2] - l3_bbox[0])
+current_x += font.getlength(line3_parts[0])
 draw.text((current_x, current_y), line3_parts[1], font=font, fill=COLOR_GRAY)
 
 # Since 2016
 # Position: Bottom right of text block? Or just below?
 # Let's put it aligned to the left of the text block, below line 3.
-since_y = current_y + line_heights[2] + int(line_spacing/2)
+since_y = current_y + line_height + int(line_spacing/2)
 draw.text((text_x, since_y), SINCE_TEXT, font=since_font, fill=COLOR_GRAY)
 
-# Final Crop
-bbox = canvas.getbbox()
-if bbox:
-    final_img = canvas.crop(bbox)
-    # Add minimal padding 5px
-    w, h = final_img.size
-    final_canvas = Image.new("RGBA", (w+10, h+10), (255, 255, 255, 255))
-    final_canvas.paste(final_img, (5, 5))
-    final_canvas.save(OUTPUT_PATH)
-    print(f"Saved to {OUTPUT_PATH}")
-else:
-    print("Error: Empty image")
+canvas.save(OUTPUT_PATH)
+print(f"Saved to {OUTPUT_PATH}")
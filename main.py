@@ -3,38 +3,56 @@ import datetime
 import argparse
 from src.config import load_categories
 from bs4 import BeautifulSoup
-from src.fetchers.rss import fetch_rss_items
+from src.fetchers.rss import canonicalize_url, fetch_rss_items
 from src.fetchers.gov import fetch_gov_announcements
-from src.generators.llm import summarize_article, rank_items_with_ai
+from src.generators.llm import summarize_articles, rank_items_with_ai, build_prompt_payload
 from src.generators.html import (
     render_daily_page, render_archive_index, render_gov_archive,
     render_member_page, render_dashboard, render_member_index
 )
 from src.utils.common import (
-    extract_source_name,
-    extract_image_url,
     format_timestamp,
     markdown_bold_to_highlight,
     parse_article_datetime,
     sanitize_summary,
     shorten_korean_title,
+    translate_titles_to_korean,
     trim_summary_lines,
 )
-from src.utils.storage import MemberStorage, GovStorage
+from src.utils.storage import MemberStorage, GovStorage, FeedCache, SummaryCache, TitleCache, ArchiveIndex, write_text_atomic
 from src.utils.wordcloud_generator import extract_weekly_keywords, create_wordcloud_image
 from collections import Counter
+from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor
 import re
 
+KST = ZoneInfo("Asia/Seoul")
+
+# Concurrent LLM summary batches per category
+SUMMARY_WORKERS = int(os.getenv("SUMMARY_WORKERS", "4"))
+
+# Concurrent member news searches (all hit news.google.com, so stay modest)
+MEMBER_SEARCH_WORKERS = 4
+
+# Characters not allowed in member page filenames
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
 
 def str_to_bool(value: str) -> bool:
     return str(value).strip().lower() in ["true", "1", "yes", "y", "on"]
 
+def list_html_files(directory: str):
+    """Names of the .html files directly inside ``directory``."""
+    # DirEntry carries the name and file type from the directory read itself
+    with os.scandir(directory) as it:
+        return [e.name for e in it if e.name.endswith(".html") and e.is_file()]
+
 def parse_existing_articles(html_path: str):
     if not os.path.exists(html_path):
         return []
 
     with open(html_path, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "html.parser")
+        soup = BeautifulSoup(f, "lxml")
 
     parsed = []
     news_articles = soup.select("article.news-item")
@@ -68,25 +86,45 @@ def parse_existing_articles(html_path: str):
     return parsed
 
 def merge_articles(primary_items, secondary_items):
-    merged = []
-    seen_links = set()
-
-    for item in primary_items + secondary_items:
-        link = item.get("link")
-        if link and link in seen_links:
-            continue
-        if link:
-            seen_links.add(link)
-        merged.append(item)
+    # Keyed on canonical URLs so a story picked up again later in the day
+    # through another feed (or with tracking params) is not listed twice;
+    # setdefault keeps the first (primary) copy, and items without a link
+    # are keyed on their identity so they are always kept
+    merged = {}
+    for items in (primary_items, secondary_items):
+        for item in items:
+            merged.setdefault(canonicalize_url(item.get("link")) or id(item), item)
+
+    return list(merged.values())
+
+def parse_run_id(run_id: str) -> datetime.datetime:
+    """Parse a "YYYY-MM-DD_HHMMSS" run id; raises ValueError for other names."""
+    # Fixed-width slicing; strptime's format parser is the slow part otherwise
+    if (len(run_id) != 17 or run_id[4] != "-" or run_id[7] != "-" or run_id[10] != "_"
+            or not (run_id[:4] + run_id[5:7] + run_id[8:10] + run_id[11:]).isdigit()):
+        raise ValueError(f"Not a run id: {run_id!r}")
+    return datetime.datetime(
+        int(run_id[:4]), int(run_id[5:7]), int(run_id[8:10]),
+        int(run_id[11:13]), int(run_id[13:15]), int(run_id[15:17]),
+    )
 
-    return merged
+def run_id_time_str(run_id: str) -> str:
+    """Time of day of an already validated run id, as HH:MM:SS."""
+    return f"{run_id[11:13]}:{run_id[13:15]}:{run_id[15:17]}"
 
 def consolidate_daily_archives(config):
+    """Merge same-day runs into the earliest file.
+
+    Returns the remaining .html names and whether any file was removed, or
+    None when the archive directory does not exist.
+    """
     daily_dir = config.archive_dir
     if not os.path.isdir(daily_dir):
-        return
+        return None
 
-    files = [f for f in os.listdir(daily_dir) if f.endswith(".html")]
+    files = list_html_files(daily_dir)
+    remaining = set(files)
+    removed = False
     grouped = {}
 
     for fname in files:
@@ -107,102 +145,140 @@ def consolidate_daily_archives(config):
             combined.extend(parse_existing_articles(path))
 
         merged_articles = merge_articles(combined, [])
+        merged_articles.sort(key=parse_article_datetime, reverse=True)
 
         primary_name = primary.replace(".html", "")
         try:
-            dt = datetime.datetime.strptime(primary_name, "%Y-%m-%d_%H%M%S")
-            date_str = dt.strftime("%Y-%m-%d")
-            time_str = dt.strftime("%H:%M:%S")
-        except Exception:
+            parse_run_id(primary_name)
+            date_str = primary_name[:10]
+            time_str = run_id_time_str(primary_name)
+        except ValueError:
             date_str = date_key
             time_str = "00:00:00"
 
         html = render_daily_page(merged_articles, date_str, time_str, config)
 
-        with open(os.path.join(daily_dir, primary), "w", encoding="utf-8") as f:
-            f.write(html)
+        write_text_atomic(os.path.join(daily_dir, primary), html)
 
         for dup in duplicates:
             try:
                 os.remove(os.path.join(daily_dir, dup))
+                remaining.discard(dup)
+                removed = True
             except Exception:
                 pass
 
-def process_category(config, now_utc, kst_timezone_offset=9):
+    return sorted(remaining), removed
+
+def process_category(config, kst_now, feed_cache=None, summary_cache=None, title_cache=None):
+    """Fetch, summarize and render one category's daily page.
+
+    Caches passed in are shared with other categories running concurrently
+    and saved by the caller; without them they are loaded and saved here.
+    """
     print(f"[{config.key.upper()}] Processing...")
-    
+
+    date_str = kst_now.strftime("%Y-%m-%d")
+    time_str = kst_now.strftime("%H:%M:%S")
+    run_id = kst_now.strftime("%Y-%m-%d_%H%M%S")
+
+    def resolve_daily_file(date_str: str, run_id: str):
+        os.makedirs(config.archive_dir, exist_ok=True)
+        html_files = [f for f in list_html_files(config.archive_dir) if f.startswith(date_str)]
+
+        if html_files:
+            html_files.sort()
+            return html_files[0], html_files[1:]
+
+        return f"{run_id}.html", []
+
+    def load_daily_archive():
+        filename, duplicates = resolve_daily_file(date_str, run_id)
+        archived_articles = []
+
+        for fname in [filename] + duplicates:
+            path = os.path.join(config.archive_dir, fname)
+            archived_articles.extend(parse_existing_articles(path))
+
+        return filename, duplicates, archived_articles
+
+    # Today's archive is local-only work; parse it while the fetch, ranking
+    # and summary calls below are waiting on the network
+    archive_loader = ThreadPoolExecutor(max_workers=1)
+    archive_future = archive_loader.submit(load_daily_archive)
+    archive_loader.shutdown(wait=False)
+
     # 1. Fetch
     if config.key == "gov":
         gov_items = fetch_gov_announcements(limit=30)
         storage = GovStorage()
         summarized_items = storage.save_announcements(gov_items)
     else:
-        # RSS Fetch
+        # RSS fetches use conditional GETs against the feed cache; LLM replies
+        # (rankings and summaries) and title translations persist across runs
+        own_caches = feed_cache is None
+        if own_caches:
+            feed_cache, summary_cache, title_cache = FeedCache(), SummaryCache(), TitleCache()
+
         raw_items = fetch_rss_items(
             config.rss_feeds, 
             selection_mode=config.selection_mode, 
-            keyword_filters=config.keyword_filters
+            keyword_filters=config.keyword_filters,
+            feed_cache=feed_cache,
+            # Ranking picks from its own candidate pool; otherwise only the
+            # articles that will be summarized are needed
+            limit=None if config.use_ai_ranking else config.max_articles,
         )
-        
+
         # Rankings (if enabled)
         if config.use_ai_ranking:
             print(f"[{config.key.upper()}] AI Ranking...")
-            selected_raw = rank_items_with_ai(raw_items, config.max_articles)
+            selected_raw = rank_items_with_ai(raw_items, config.max_articles, cache=summary_cache)
         else:
             selected_raw = raw_items[:config.max_articles]
              
-        # Summarize
-        summarized_items = []
-        for idx, (ts, title, link, content, entry) in enumerate(selected_raw):
-            text_with_url = content + f"\n\nURL: {link}"
+        # Summarize (reusing summaries of articles seen in earlier runs)
+
+        def format_item(article, summary):
             try:
-                summary = summarize_article(text_with_url, title, config.display_name)
                 summary = sanitize_summary(summary)
                 summary = trim_summary_lines(summary)
             except Exception as e:
                 print(f"[{config.key}] Summarization error: {e}")
                 summary = "요약 실패"
 
-            summarized_items.append({
-                "title": shorten_korean_title(title),
-                "link": link,
-                "summary_html": summary,
-                "published_display": format_timestamp(ts),
-                "source_name": extract_source_name(entry, link),
-                "image_url": extract_image_url(entry),
-                "original_title": title
-            })
-            
-    # Markdown processing for AI items
-    if config.key != "gov":
-        for item in summarized_items:
-            item["summary_html"] = markdown_bold_to_highlight(item["summary_html"])
-
-    def resolve_daily_file(date_str: str, run_id: str):
-        os.makedirs(config.archive_dir, exist_ok=True)
-        html_files = [
-            f for f in os.listdir(config.archive_dir)
-            if f.endswith(".html") and f.startswith(date_str)
+            return {
+                "title": shorten_korean_title(article.title, cache=title_cache),
+                "link": article.link,
+                "summary": summary,
+                # Render the highlight HTML once, alongside the summary it derives from
+                "summary_html": markdown_bold_to_highlight(summary),
+                "published_display": format_timestamp(article.ts),
+                "source_name": article.source_name,
+                "image_url": article.image_url,
+                "original_title": article.title
+            }
+
+        # Translate all selected titles up front in as few requests as possible;
+        # shorten_korean_title then reads them back from the title cache
+        translate_titles_to_korean([item.title for item in selected_raw], cache=title_cache)
+
+        # Several articles go out per LLM request and batches run concurrently;
+        # summaries come back in ranking order
+        payloads = [
+            (build_prompt_payload(article.content, article.link), article.title, article.link)
+            for article in selected_raw
         ]
+        summaries = summarize_articles(payloads, config.display_name, cache=summary_cache, max_workers=SUMMARY_WORKERS)
+        summarized_items = [format_item(article, summary) for article, summary in zip(selected_raw, summaries)]
 
-        if html_files:
-            html_files.sort()
-            return html_files[0], html_files[1:]
-
-        return f"{run_id}.html", []
+        if own_caches:
+            feed_cache.save()
+            summary_cache.save()
+            title_cache.save()
 
     # 2. Render Page
-    kst_now = now_utc + datetime.timedelta(hours=kst_timezone_offset)
-    date_str = kst_now.strftime("%Y-%m-%d")
-    time_str = kst_now.strftime("%H:%M:%S")
-    run_id = kst_now.strftime("%Y-%m-%d_%H%M%S")
-
-    filename, duplicates = resolve_daily_file(date_str, run_id)
-    archived_articles = []
-
-    for fname in [filename] + duplicates:
-        path = os.path.join(config.archive_dir, fname)
-        archived_articles.extend(parse_existing_articles(path))
+    filename, duplicates, archived_articles = archive_future.result()
 
     merged_items = merge_articles(summarized_items, archived_articles)
     merged_items = sorted(merged_items, key=parse_article_datetime, reverse=True)
@@ -210,8 +286,7 @@ def process_category(config, now_utc, kst_timezone_offset=9):
     html = render_daily_page(merged_items, date_str, time_str, config)
 
     # 3. Save
-    with open(os.path.join(config.archive_dir, filename), "w", encoding="utf-8") as f:
-        f.write(html)
+    write_text_atomic(os.path.join(config.archive_dir, filename), html)
 
     # Clean up duplicate runs for the same day now that they are merged
     for dup in duplicates:
@@ -233,14 +308,11 @@ def latest_daily_page_path(config):
     if not os.path.isdir(config.archive_dir):
         return None
 
-    html_files = sorted(
-        [f for f in os.listdir(config.archive_dir) if f.endswith(".html")],
-        reverse=True
-    )
-    if not html_files:
+    # Run ids sort chronologically, so the newest page is simply the max name
+    latest_filename = max(list_html_files(config.archive_dir), default=None)
+    if not latest_filename:
         return None
 
-    latest_filename = html_files[0]
     rel_dir = os.path.relpath(config.archive_dir, "docs")
     return f"{rel_dir}/{latest_filename}"
 
@@ -250,7 +322,7 @@ def parse_preview_articles_from_html(html_path, limit=5):
         return []
 
     with open(html_path, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "html.parser")
+        soup = BeautifulSoup(f, "lxml")
 
     previews = []
     for article in soup.select("article.news-item")[:limit]:
@@ -279,8 +351,8 @@ def parse_preview_articles_from_html(html_path, limit=5):
     return previews
 
 
-def load_latest_articles_from_archive(config, limit=5):
-    latest_path = latest_daily_page_path(config)
+def load_latest_articles_from_archive(config, limit=5, latest_path=None):
+    latest_path = latest_path or latest_daily_page_path(config)
     if not latest_path:
         return []
 
@@ -318,9 +390,54 @@ def load_existing_members_latest(limit=5):
     collected.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
     return collected[:limit]
 
-def rebuild_indexes(categories, consolidate_archives=False):
+WEEKDAY_MAP = {0:'월', 1:'화', 2:'수', 3:'목', 4:'금', 5:'토', 6:'일'}
+
+def build_run_entry(filename):
+    name_part = filename.replace(".html", "")
+    try:
+        dt = parse_run_id(name_part)
+    except ValueError:
+        return {"filename": filename, "date_str": filename, "time_str": "", "day_of_week": ""}
+
+    return {
+        "filename": filename,
+        "date_str": name_part[:10],
+        "time_str": run_id_time_str(name_part),
+        "day_of_week": WEEKDAY_MAP[dt.weekday()]
+    }
+
+def collect_run_entries(config, filenames=None, known_entries=None):
+    """Build run entries, one per date (newest first).
+
+    ``filenames`` is an already-known listing of the archive's .html files;
+    without it the archive directory is scanned. Entries in ``known_entries``
+    (e.g. the stored manifest) are reused for files they already describe.
+    """
+    if filenames is None:
+        filenames = list_html_files(config.archive_dir)
+    files = sorted(filenames, reverse=True)
+
+    # Names sort newest first, so the last name seen for a date is its earliest
+    # run and dict insertion order is already newest-date-first.
+    earliest_by_date = {}
+    for f in files:
+        earliest_by_date[f.split("_")[0]] = f
+
+    known = {e["filename"]: e for e in known_entries or []}
+    return [known.get(f) or build_run_entry(f) for f in earliest_by_date.values()]
+
+def upsert_run_entry(entries, filename):
+    """Add this run's daily file to a newest-first entry list, replacing its date."""
+    date_part = filename.split("_")[0]
+    updated = [e for e in entries if e["filename"].split("_")[0] != date_part]
+    updated.insert(0, build_run_entry(filename))
+    # Already ordered unless an older date was regenerated; timsort is linear then
+    updated.sort(key=lambda e: e["filename"], reverse=True)
+    return updated
+
+def rebuild_indexes(categories, consolidate_archives=False, latest_runs=None):
     # Daily Archives Index Generation
-    weekday_map = {0:'월', 1:'화', 2:'수', 3:'목', 4:'금', 5:'토', 6:'일'}
+    latest_runs = latest_runs or {}
 
     for key, cfg in categories.items():
         if key == "gov":
@@ -328,46 +445,35 @@ def rebuild_indexes(categories, consolidate_archives=False):
             announcements = sort_gov_announcements(storage.load_announcements())
 
             index_html = render_gov_archive(announcements)
-            with open(cfg.index_path, "w", encoding="utf-8") as f:
-                f.write(index_html)
+            write_text_atomic(cfg.index_path, index_html)
             continue
 
+        # Consolidation lists the archive anyway; reuse its listing below
+        archive_files, removed = None, False
         if consolidate_archives:
-            consolidate_daily_archives(cfg)
+            consolidated = consolidate_daily_archives(cfg)
+            if consolidated is not None:
+                archive_files, removed = consolidated
 
         daily_dir = cfg.archive_dir
         if not os.path.exists(daily_dir):
             continue
-            
-        files = sorted([f for f in os.listdir(daily_dir) if f.endswith(".html")], reverse=True)
-        earliest_by_date = {}
-
-        for f in files:
-            date_part = f.split("_")[0]
-            existing = earliest_by_date.get(date_part)
-            if existing is None or f < existing:
-                earliest_by_date[date_part] = f
-
-        entries = []
-        for f in sorted(earliest_by_date.values(), reverse=True):
-            name_part = f.replace(".html", "")
-            try:
-                dt = datetime.datetime.strptime(name_part, "%Y-%m-%d_%H%M%S")
-                # Add Weekday
-                wd = weekday_map[dt.weekday()]
 
-                entries.append({
-                    "filename": f,
-                    "date_str": dt.strftime("%Y-%m-%d"),
-                    "time_str": dt.strftime("%H:%M:%S"),
-                    "day_of_week": wd
-                })
-            except:
-                entries.append({"filename": f, "date_str": f, "time_str": "", "day_of_week": ""})
+        # When consolidation deleted files, re-derive the list from its
+        # listing (reusing already-parsed manifest entries); otherwise update
+        # the manifest in place. A missing manifest falls back to a scan.
+        archive_index = ArchiveIndex(key)
+        stored = archive_index.load()
+        if removed or stored is None:
+            entries = collect_run_entries(cfg, archive_files, known_entries=stored)
+        elif key in latest_runs:
+            entries = upsert_run_entry(stored, latest_runs[key])
+        else:
+            entries = stored
+        archive_index.save(entries)
         
         index_html = render_archive_index(entries, cfg)
-        with open(cfg.index_path, "w", encoding="utf-8") as f:
-            f.write(index_html)
+        write_text_atomic(cfg.index_path, index_html)
 
 
 def process_members(limit_per_member=None):
@@ -380,36 +486,54 @@ def process_members(limit_per_member=None):
     
     members = load_members()
     storage = MemberStorage()
+    title_cache = TitleCache()
     print(f"[Members] Found {len(members)} companies. Fetching news...")
 
     all_latest_news = []
+    # Histories written this run, reused for the members index below
+    histories = {}
+
+    # 1. Fetch Request: the searches are independent network waits, so run
+    # them concurrently up front (map keeps member order)
+    limit = limit_per_member if limit_per_member else 3
+
+    def search_member(member):
+        try:
+            return fetch_search_news(member.keywords, limit=limit)
+        except Exception as e:
+            print(f"  - Error {member.name}: {e}")
+            return []
+
+    with ThreadPoolExecutor(max_workers=MEMBER_SEARCH_WORKERS) as ex:
+        search_results = list(ex.map(search_member, members.values()))
+
+    # Translate every member's titles together in as few requests as possible
+    translate_titles_to_korean(
+        [item.title for raw_items in search_results for item in raw_items], cache=title_cache
+    )
     
-    for m_key, member in members.items():
+    for (m_key, member), raw_items in zip(members.items(), search_results):
         try:
-            # 1. Fetch Request
-            limit = limit_per_member if limit_per_member else 3
-            raw_items = fetch_search_news(member.keywords, limit=limit)
-             
             if raw_items:
                 print(f"  - Found {len(raw_items)} for {member.name}")
             
             # 2. Format
             new_articles = []
-            for ts, title, link, content, entry in raw_items:
-                summary = sanitize_summary(content)
+            for article in raw_items:
+                summary = sanitize_summary(article.content)
                 summary = trim_summary_lines(summary)
                 formatted_summary = markdown_bold_to_highlight(summary)
 
                 new_articles.append({
                     "member_name": member.name,
-                    "title": shorten_korean_title(title),
-                    "link": link,
-                    "published_display": format_timestamp(ts),
+                    "title": shorten_korean_title(article.title, cache=title_cache),
+                    "link": article.link,
+                    "published_display": format_timestamp(article.ts),
                     "summary_html": formatted_summary, # Search returns snippet
-                    "source_name": extract_source_name(entry, link),
-                    "image_url": extract_image_url(entry),
-                    "timestamp": ts,
-                    "original_title": title
+                    "source_name": article.source_name,
+                    "image_url": article.image_url,
+                    "timestamp": article.ts,
+                    "original_title": article.title
                 })
             
             # 3. Save/Merge with persistence
@@ -420,19 +544,21 @@ def process_members(limit_per_member=None):
             
             # Sort by timestamp desc
             updated_history.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
+            histories[m_key] = updated_history
             
             html = render_member_page(member, updated_history, now_str)
             
-            safe_name = re.sub(r'[<>:"/\\|?*]', '_', m_key).strip()
+            safe_name = _UNSAFE_FILENAME_RE.sub('_', m_key).strip()
             page_filename = f"{safe_name}.html" 
             
-            with open(os.path.join(member_page_dir, page_filename), "w", encoding="utf-8") as f:
-                f.write(html)
+            write_text_atomic(os.path.join(member_page_dir, page_filename), html)
             
             all_latest_news.extend(updated_history[:2])
             
         except Exception as e:
             print(f"  - Error {member.name}: {e}")
+
+    title_cache.save()
             
     # Sort all collected news by timestamp and take top 5
     all_latest_news.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
@@ -442,11 +568,13 @@ def process_members(limit_per_member=None):
     weekday_map = {0:'월', 1:'화', 2:'수', 3:'목', 4:'금', 5:'토', 6:'일'}
     
     for m_key, member in members.items():
-        history = storage.load_news(m_key)
+        history = histories.get(m_key)
+        if history is None:
+            history = storage.load_news(m_key)
         count = len(history)
         
         # Safe name
-        safe_name = re.sub(r'[<>:"/\\|?*]', '_', m_key).strip()
+        safe_name = _UNSAFE_FILENAME_RE.sub('_', m_key).strip()
         
         # Latest date
         latest_str = "-"
@@ -473,25 +601,24 @@ def process_members(limit_per_member=None):
     member_entries.sort(key=lambda x: (-x["count"], x["name"]))
     
     # Cleanup stale files
-    existing_files = set(os.listdir(member_page_dir))
     generated_files = {entry["filename"] for entry in member_entries}
     generated_files.add("index.html")
     
-    for filename in existing_files:
-        if filename.endswith(".html") and filename not in generated_files:
+    for filename in list_html_files(member_page_dir):
+        if filename not in generated_files:
             file_path = os.path.join(member_page_dir, filename)
             try:
                 os.remove(file_path)
             except: pass
     
     idx_html = render_member_index(member_entries)
-    with open("docs/members/index.html", "w", encoding="utf-8") as f:
-        f.write(idx_html)
+    write_text_atomic("docs/members/index.html", idx_html)
         
     return all_latest_news[:5]
 
 def main():
-    now_utc = datetime.datetime.now(datetime.timezone.utc)
+    # Run ids, page dates and "Updated at" times are all Korean time
+    kst_now = datetime.datetime.now(KST)
     
     parser = argparse.ArgumentParser()
     parser.add_argument("--limit", type=int, default=None, help="Limit number of articles per category for testing")
@@ -519,6 +646,8 @@ def main():
 
     # 1. Process Categories
     categories = load_categories()
+    latest_runs = {}
+    active = []
     for key, config in categories.items():
         if not run_flags.get(key, True):
             print(f"[{key}] Skipped by configuration.")
@@ -528,20 +657,51 @@ def main():
                 dashboard_data["gov"] = announcements[:5]
                 dashboard_data["links"]["gov"] = "gov/index.html"
             else:
-                fallback_articles = load_latest_articles_from_archive(config)
+                fallback_path = latest_daily_page_path(config)
+                fallback_articles = load_latest_articles_from_archive(config, latest_path=fallback_path)
                 if fallback_articles:
                     dashboard_data[key] = fallback_articles
 
-                fallback_path = latest_daily_page_path(config)
                 if fallback_path:
                     dashboard_data["links"][key] = fallback_path
             continue
 
         if args.limit:
             config.max_articles = args.limit
+        active.append((key, config))
+
+    # Categories share no articles, so run them concurrently. The LLM rate
+    # limiters are module level and keep the combined request rate within
+    # quota; the caches are shared (one load, one save) so concurrent
+    # categories do not overwrite each other's entries.
+    if active:
+        feed_cache = FeedCache()
+        summary_cache = SummaryCache()
+        title_cache = TitleCache()
+
+        def run_category(config):
+            try:
+                return process_category(
+                    config, kst_now,
+                    feed_cache=feed_cache, summary_cache=summary_cache, title_cache=title_cache,
+                )
+            except Exception as e:
+                print(f"[{config.key}] Failed: {e}")
+                import traceback
+                traceback.print_exc()
+                return None
 
-        try:
-            res = process_category(config, now_utc)
+        with ThreadPoolExecutor(max_workers=len(active)) as ex:
+            results = list(ex.map(run_category, [config for _, config in active]))
+
+        feed_cache.save()
+        summary_cache.save()
+        title_cache.save()
+    else:
+        results = []
+
+    for (key, config), res in zip(active, results):
+        if res:
             print(f"[{key}] Generated: {res['filename']}")
             dashboard_data[key] = res.get("items", [])
             # Store latest filename relative to docs root
@@ -549,16 +709,14 @@ def main():
             # config.archive_dir is "docs/ai/daily"
             rel_path = f"{key}/daily/{res['filename']}"
             dashboard_data["links"][key] = rel_path
+            latest_runs[key] = res["filename"]
 
-        except Exception as e:
-            print(f"[{key}] Failed: {e}")
-            import traceback
-            traceback.print_exc()
-
-        # Ensure the dashboard has a path to the newest available daily page
-        fallback_path = latest_daily_page_path(config)
-        if fallback_path:
-            dashboard_data["links"].setdefault(key, fallback_path)
+        # Ensure the dashboard has a path to the newest available daily page;
+        # a successful run already recorded it, so only rescan on failure
+        if key not in dashboard_data["links"]:
+            fallback_path = latest_daily_page_path(config)
+            if fallback_path:
+                dashboard_data["links"][key] = fallback_path
 
         if key == "gov":
             dashboard_data["links"]["gov"] = "gov/index.html"
@@ -581,7 +739,8 @@ def main():
     # 3. Rebuild Indexes
     rebuild_indexes(
         categories,
-        consolidate_archives=str_to_bool(os.getenv("CONSOLIDATE_ARCHIVES", "true")) or args.consolidate_archives
+        consolidate_archives=str_to_bool(os.getenv("CONSOLIDATE_ARCHIVES", "true")) or args.consolidate_archives,
+        latest_runs=latest_runs
     )
 
     # 3.5 Generate Word Cloud
@@ -604,8 +763,7 @@ def main():
             members_latest=dashboard_data.get("members", [])[:5],
             section_links=dashboard_data.get("links", {})
         )
-        with open("docs/index.html", "w", encoding="utf-8") as f:
-            f.write(dash_html)
+        write_text_atomic("docs/index.html", dash_html)
         print("[Dashboard] Index generated.")
         
         # 5. Asset Deployment
@@ -1,42 +1,202 @@
 import time
+import calendar
+import heapq
 import feedparser
 import random
-from typing import List, Dict, Any
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import List, Dict, Optional, Tuple
+from src.utils.common import extract_image_url, extract_source_name, html_to_text
 
-def fetch_rss_items(feeds: List[str], selection_mode: str = "time", keyword_filters: List[str] = None) -> List[tuple]:
+# Upper bound on concurrent feed downloads; feeds are network bound, but
+# several share a host (technologyreview, aitimes) so stay polite
+MAX_FETCH_WORKERS = 8
+
+# Identify the crawler; some hosts (e.g. reddit) throttle the generic default.
+USER_AGENT = "ai-news-daily/1.0 (+https://github.com/vaax-maker/ai-news-daily)"
+
+FEED_TIMEOUT = 10
+
+# One keep-alive session shared by every feed download (and the member news
+# search), so repeat requests to a host reuse its TCP/TLS connection.
+# requests negotiates gzip/deflate by default.
+# Categories fetch concurrently through this one session, so keep a pool for
+# every configured host (~15) rather than evicting them between categories.
+HTTP_POOL_HOSTS = 32
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers["User-Agent"] = USER_AGENT
+_adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=16)
+HTTP_SESSION.mount("https://", _adapter)
+HTTP_SESSION.mount("http://", _adapter)
+
+def parse_feed_response(resp, **kwargs):
+    """Hand a downloaded feed body to feedparser with its HTTP headers."""
+    headers = {k.lower(): v for k, v in resp.headers.items()}
+    # feedparser resolves the feed's base URI from content-location
+    headers.setdefault("content-location", resp.url)
+    return feedparser.parse(resp.content, response_headers=headers, **kwargs)
+
+# Query parameters that only track the referrer; anything else (e.g. ?idxno=)
+# can identify the article and is kept
+_TRACKING_PARAM_PREFIXES = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+def canonicalize_url(url: str) -> str:
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    ))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+# Syndicated copies often differ only in quote style, dashes or spacing
+_TITLE_NOISE_RE = re.compile(r"[\W_]+")
+
+def _normalize_title(title: str) -> str:
+    return _TITLE_NOISE_RE.sub("", (title or "").lower())
+
+@dataclass(slots=True)
+class Article:
+    """A feed item reduced to the fields used downstream.
+
+    The image URL and source name are extracted up front so the parsed
+    feedparser entry (and its HTML) can be dropped right after parsing.
+    """
+    ts: float
+    title: str
+    link: str
+    content: str
+    image_url: str = ""
+    source_name: str = ""
+
+def article_from_entry(entry) -> Article:
+    title = entry.get("title", "")
+    link = entry.get("link", "")
+    content = entry.get("summary", "") or entry.get("description", "")
+
+    published = entry.get("published_parsed") or entry.get("updated_parsed")
+    if published:
+        # feedparser normalizes dates to UTC struct_time; timegm reads them as
+        # such (mktime would apply the local zone) and skips the DST lookup
+        ts = calendar.timegm(published)
+    else:
+        ts = 0
+
+    return Article(
+        ts=ts,
+        title=title,
+        link=link,
+        content=content,
+        image_url=extract_image_url(entry),
+        source_name=extract_source_name(entry, link),
+    )
+
+# Bump when the cached entry layout changes; older feed cache states are
+# ignored (fetched unconditionally) instead of being misread
+_FEED_CACHE_FORMAT = 3
+
+# Feed item text kept per entry: the keyword filter and the summarizer prompt
+# (MAX_PROMPT_CONTENT_CHARS) only ever read this much plain text
+FEED_CONTENT_CHARS = 2000
+
+def _fetch_feed(feed_url: str, cached: Optional[Dict] = None) -> Tuple[List[Article], Optional[Dict]]:
+    """Fetch one feed, returning its items and the new cache state (None = keep)."""
+    if not cached or cached.get("format") != _FEED_CACHE_FORMAT:
+        cached = {}
+    items = []
+    try:
+        # Conditional GET: an unchanged feed answers 304 with no body
+        request_headers = {}
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            request_headers["If-Modified-Since"] = cached["modified"]
+
+        resp = HTTP_SESSION.get(feed_url, headers=request_headers, timeout=FEED_TIMEOUT)
+        status = resp.status_code
+        if status == 304 and "entries" in cached:
+            # Still in use: refresh its age so the cache does not expire it
+            return [Article(**c) for c in cached["entries"]], dict(cached, checked_at=int(time.time()))
+        resp.raise_for_status()
+
+        # Entry HTML only feeds the summarizer prompt and the <img> lookup and is
+        # never rendered, so skip feedparser's per-entry HTML sanitizer and
+        # relative-URI rewriting passes; extract_image_url resolves the one
+        # image URL it picks against the article link instead.
+        d = parse_feed_response(resp, sanitize_html=False, resolve_relative_uris=False)
+
+        items = [article_from_entry(entry) for entry in d.entries]
+        # Reduce entry HTML to the text used downstream (images are already
+        # extracted), so the committed feed cache holds no raw markup
+        for item in items:
+            item.content = html_to_text(item.content, FEED_CONTENT_CHARS)
+
+        # Only remember successful HTTP responses that carry validators
+        etag = resp.headers.get("ETag")
+        modified = resp.headers.get("Last-Modified")
+        if status == 200 and (etag or modified):
+            return items, {
+                "format": _FEED_CACHE_FORMAT,
+                "checked_at": int(time.time()),
+                "etag": etag,
+                "modified": modified,
+                "entries": [asdict(item) for item in items],
+            }
+    except Exception as e:
+        print(f"[RSS Fetch Error] {feed_url}: {e}")
+    return items, None
+
+def fetch_rss_items(feeds: List[str], selection_mode: str = "time", keyword_filters: List[str] = None, feed_cache=None, limit: Optional[int] = None) -> List[Article]:
+    """Fetch, dedupe and filter feed items; ``limit`` caps the returned list."""
     raw_items = []
-    
-    for feed_url in feeds:
-        try:
-            d = feedparser.parse(feed_url)
-            for entry in d.entries:
-                title = getattr(entry, "title", "")
-                link = getattr(entry, "link", "")
-                content = getattr(entry, "summary", "") or getattr(entry, "description", "")
-                
-                published = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
-                if published:
-                    ts = time.mktime(published)
-                else:
-                    ts = 0
-                
-                raw_items.append((ts, title, link, content, entry))
-        except Exception as e:
-            print(f"[RSS Fetch Error] {feed_url}: {e}")
-
-    # Keyword Filtering
-    if keyword_filters:
-        low_kws = [k.lower() for k in keyword_filters]
-        if selection_mode == "keyword" or low_kws:
-             raw_items = [
-                item for item in raw_items
-                if any(kw in ((item[1] or "") + " " + (item[3] or "")).lower() for kw in low_kws)
-            ]
+
+    if feeds:
+        cached_states = [feed_cache.get(url) if feed_cache else None for url in feeds]
+
+        # Download feeds concurrently; map() keeps the configured feed order
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(feeds))) as ex:
+            results = list(ex.map(_fetch_feed, feeds, cached_states))
+
+        for feed_url, (items, state) in zip(feeds, results):
+            raw_items.extend(items)
+            if feed_cache is not None and state is not None:
+                feed_cache.update(feed_url, state)
+
+    # Drop the same article syndicated by several feeds (first feed wins)
+    seen_links = set()
+    seen_titles = set()
+    unique_items = []
+    for item in raw_items:
+        link_key = canonicalize_url(item.link)
+        title_key = _normalize_title(item.title)
+        if (link_key and link_key in seen_links) or (title_key and title_key in seen_titles):
+            continue
+        if link_key:
+            seen_links.add(link_key)
+        if title_key:
+            seen_titles.add(title_key)
+        unique_items.append(item)
+    raw_items = unique_items
+
+    # Keyword Filtering: one case-insensitive alternation scans each text once
+    # for all keywords, without building a lowercased title+content copy
+    keywords = [k for k in (keyword_filters or []) if k]
+    if keywords:
+        keyword_re = re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+        raw_items = [
+            item for item in raw_items
+            if keyword_re.search(item.title or "") or keyword_re.search(item.content or "")
+        ]
 
     # Time Filtering (Last 48 hours for robustness)
     two_days_ago = time.time() - 48 * 60 * 60
-    filtered_items = [item for item in raw_items if item[0] >= two_days_ago]
-    
+    filtered_items = [item for item in raw_items if item.ts >= two_days_ago]
+
     # Use filtered if we have enough items, else fallback to raw
     if len(filtered_items) >= 5:
         target_items = filtered_items
@@ -45,13 +205,17 @@ def fetch_rss_items(feeds: List[str], selection_mode: str = "time", keyword_filt
 
     # Sorting logic
     three_days_ago = time.time() - 3 * 24 * 60 * 60
-    
+
     if selection_mode == "random":
-        recent = [item for item in target_items if item[0] >= three_days_ago]
+        recent = [item for item in target_items if item.ts >= three_days_ago]
         candidates = recent if recent else target_items
+        if limit is not None:
+            return random.sample(candidates, min(limit, len(candidates)))
         random.shuffle(candidates)
         return candidates
     else:
-        # Default: time desc
-        target_items.sort(key=lambda x: x[0], reverse=True)
+        # Default: time desc; with a limit only the top entries are ordered
+        if limit is not None:
+            return heapq.nlargest(limit, target_items, key=lambda x: x.ts)
+        target_items.sort(key=lambda x: x.ts, reverse=True)
         return target_items
@@ -1,9 +1,8 @@
-import time
 import urllib.parse
-import feedparser
 from typing import List
+from src.fetchers.rss import FEED_TIMEOUT, HTTP_SESSION, Article, article_from_entry, parse_feed_response
 
-def fetch_search_news(keywords: List[str], limit: int = 10) -> List[tuple]:
+def fetch_search_news(keywords: List[str], limit: int = 10) -> List[Article]:
     if not keywords:
         return []
     
@@ -16,25 +15,16 @@ def fetch_search_news(keywords: List[str], limit: int = 10) -> List[tuple]:
     
     raw_items = []
     try:
-        d = feedparser.parse(rss_url)
-        for entry in d.entries:
-            title = getattr(entry, "title", "")
-            link = getattr(entry, "link", "")
-            content = getattr(entry, "summary", "") or getattr(entry, "description", "")
-            
-            published = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
-            if published:
-                ts = time.mktime(published)
-            else:
-                ts = 0
-            
-            raw_items.append((ts, title, link, content, entry))
-            
+        resp = HTTP_SESSION.get(rss_url, timeout=FEED_TIMEOUT)
+        resp.raise_for_status()
+        d = parse_feed_response(resp)
+        raw_items = [article_from_entry(entry) for entry in d.entries]
+
     except Exception as e:
         print(f"[Search Fetch Error] Query={keywords}: {e}")
         return []
 
     # Sort by time desc
-    raw_items.sort(key=lambda x: x[0], reverse=True)
+    raw_items.sort(key=lambda x: x.ts, reverse=True)
     
     return raw_items[:limit]
@@ -1,22 +1,28 @@
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, select_autoescape
 import os
 import datetime
-from src.utils.common import parse_article_datetime
 
 # Setup Jinja2 env
 TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "templates")
-env = Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+# Templates do not change during a run: compile each once and skip the
+# per-get_template mtime check (member pages render ~100 times per run).
+# Feed titles, links and sources are plain text and escaped on output; the
+# templates mark the pre-rendered summary_html as |safe.
+env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    auto_reload=False,
+    autoescape=select_autoescape(["html"]),
+)
 
 def render_daily_page(articles, date_str, time_str, config, active_tab="home"):
-    sorted_articles = sorted(articles, key=parse_article_datetime, reverse=True)
-
+    """Render a daily page; ``articles`` must already be sorted newest first."""
     if config.is_table_view:
         template = env.get_template("daily_table.html")
     else:
         template = env.get_template("daily_list.html")
 
     return template.render(
-        articles=sorted_articles,
+        articles=articles,
         date_str=date_str,
         time_str=time_str,
         category_display_name=config.display_name,
@@ -1,10 +1,20 @@
 import os
 import time
 import re
+import json
+import math
+import hashlib
+import heapq
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import google.generativeai as genai
 from google.api_core import exceptions
 import groq as groq_lib
 from typing import List
+from src.fetchers.rss import Article
+from src.utils.common import html_to_text
 
 # Heuristic keyword buckets for lightweight ranking
 IMPORTANT_COMPANIES = [
@@ -26,12 +36,180 @@ try:
 except ImportError:
     Groq = None
 
+# Grok (Groq) Config; resolved once at import like the Gemini model below
+GROK_MODEL_NAME = os.getenv("GROK_MODEL", "llama-3.3-70b-versatile")
+
 # Gemini Config
 MAX_GEMINI_RETRY_DELAY = 15.0
+GEMINI_MODEL_NAME = "gemini-2.5-flash-preview-09-2025"
+# Explicit context caching has a minimum cacheable size; opt in once the
+# system instruction is large enough to qualify.
+GEMINI_CONTEXT_CACHE = os.getenv("GEMINI_CONTEXT_CACHE", "false").lower() == "true"
+GEMINI_CONTEXT_CACHE_TTL = datetime.timedelta(hours=1)
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"[LLM] Ignoring non-numeric {name}={value!r}, using {default}")
+        return default
+
+# Request budgets per provider (requests per minute); summaries run
+# concurrently. 0 (or any non-positive value) disables the limit.
+GROK_RPM = _env_float("GROK_RPM", 30.0)
+GEMINI_RPM = _env_float("GEMINI_RPM", 10.0)
+RATE_LIMIT_BURST = 5
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests/sec with bursts of `burst`.
+
+    Callers only block when the bucket is empty, instead of sleeping a fixed
+    interval after every request. A non-positive (or non-finite) rate means
+    no limit: acquire() and defer() return immediately.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.unlimited = not (math.isfinite(rate) and rate > 0)
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if self.unlimited:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve a token up front; a negative balance queues later callers
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def defer(self, seconds: float):
+        """Hold back every caller for `seconds`, e.g. after a server-side 429.
+
+        The bucket is drained and pushed into debt, so the next acquire() on
+        any thread waits out the delay instead of retrying into the quota.
+        """
+        if self.unlimited:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+_GROK_LIMITER = RateLimiter(GROK_RPM / 60.0, burst=RATE_LIMIT_BURST)
+_GEMINI_LIMITER = RateLimiter(GEMINI_RPM / 60.0, burst=RATE_LIMIT_BURST)
+
+# Process-wide cap on in-flight LLM requests, shared by every caller thread
+# (the limiters above bound the start rate, this bounds concurrency)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "5"))
+_LLM_SLOTS = threading.BoundedSemaphore(LLM_MAX_CONCURRENCY)
+
+# Article characters sent to the summarizer (see build_prompt_payload)
+MAX_PROMPT_CONTENT_CHARS = 2000
+
+# Articles summarized per LLM request by summarize_articles
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "5"))
+
+# Batch replies put multi-line summaries inside JSON strings; models often
+# leave the line breaks raw, which strict JSON rejects
+_LENIENT_JSON = json.JSONDecoder(strict=False)
+_RETRY_RE = re.compile(r"retry in ([0-9]+(?:\.[0-9]+)?)s")
+_DIGITS_RE = re.compile(r"\d+")
+
+# Bump when the summary prompt changes so cached summaries are regenerated
+SUMMARY_PROMPT_VERSION = "v1"
+
+# === 개선된 프롬프트 적용 ===
+# Fixed instructions go out as the system instruction (and, for Gemini, can
+# be held in an explicit context cache); only the article itself varies.
+SUMMARY_SYSTEM_TEMPLATE = """
+너는 스타트업 대표의 의사결정을 지원하는 전문 뉴스 분석 에이전트임.
+아래 규칙에 따라 {display_name} 관련 기사를 "한글"로 구조화해 요약할 것.
+
+[요약 규칙]
+1. 기사의 핵심을 육하원칙(누가·언제·어디·무엇·왜·어떻게)에 따라 3~4줄로 요약할 것.
+2. 배경, 조건/제약, 수치·데이터(금액·비율·규모·일정 등)를 포함할 것.
+3. 중요한 문맥 2~3개는 반드시 **굵게** 표시할 것.
+4. 모든 문장은 명사형 종결(~함, ~임, ~되었음 등)으로 끝낼 것.
+5. 제목이 영문일 경우, 최상단에 반드시 한글 번역 제목을 1줄로 제시할 것.
+
+[출력 형식]
+[제목]
+· (영문 제목일 경우) 한글 번역 1줄
+
+[요약]
+· 핵심 3~4줄
+· 가장 중요한 문맥은 **굵게**
+
+[의미]
+· 산업구조/경쟁/시장기회 또는 리스크 중 가장 핵심 1줄로 요약
+"""
+
+SUMMARY_INPUT_TEMPLATE = """
+아래 원문을 요약할 것.
+
+제목: {title}
+
+내용:
+{text}
+"""
+
+# Several articles per request: the same rules, but the reply is one JSON
+# array holding each article's multi-line summary as a string
+SUMMARY_BATCH_SYSTEM_TEMPLATE = SUMMARY_SYSTEM_TEMPLATE + """
+[여러 기사 출력 형식]
+- 기사마다 위 [출력 형식]([제목]/[요약]/[의미])대로 요약하되, 각 요약 전체를 JSON 문자열 하나에 담을 것.
+- 요약 안의 줄바꿈은 \\n 으로 표기할 것.
+- 기사 순서대로 요약 문자열을 담은 JSON 배열 하나만 출력하고, 배열 앞뒤에 다른 설명을 붙이지 말 것.
+"""
+
+SUMMARY_BATCH_INPUT_TEMPLATE = """
+아래 {count}개 기사를 각각 규칙에 따라 요약할 것.
+결과는 기사 순서대로 요약문 {count}개를 담은 JSON 배열로 출력할 것.
+(예: ["[제목]\\n· 1번 기사 제목\\n\\n[요약]\\n· ...", "[제목]\\n· 2번 기사 제목\\n\\n[요약]\\n· ..."])
+
+{articles}
+"""
+
+SUMMARY_BATCH_ARTICLE_TEMPLATE = """
+### 기사 {index}
+제목: {title}
+
+내용:
+{text}
+"""
+
+RANKING_PROMPT_TEMPLATE = """
+다음은 다양한 테크 뉴스 기사들의 제목 리스트야.
+이 중에서 오늘날짜 뉴스레터에 포함시킬 가장 '중요하고 의미 있는' 기사 {limit}개를 골라줘.
+
+중요도 판단 기준:
+1. 주요 기술 기업(OpenAI, Google, Apple, 삼성, LG 등)의 새로운 제품/모델 출시
+2. AI 분야의 획기적인 연구 성과나 논문
+3. 업계의 큰 인수합병이나 정책 변화
+4. 단순 튜토리얼이나 홍보성 기사는 제외
+
+응답 형식:
+- 가장 중요하다고 생각되는 기사의 '인덱스 번호'만 쉼표(,)로 나열해줘.
+- 예: 1, 5, 10, 3, 2
+
+[기사 목록]
+{candidates_text}
+"""
 
 def _extract_retry_delay(exc: Exception, default: float = 30.0) -> float:
     message = str(exc).lower()
-    match = re.search(r"retry in ([0-9]+(?:\.[0-9]+)?)s", message)
+    match = _RETRY_RE.search(message)
     if match:
         try:
             return min(float(match.group(1)), MAX_GEMINI_RETRY_DELAY)
@@ -72,35 +250,73 @@ def _score_title(title: str) -> int:
 
     return score
 
-def _rank_with_heuristics(items: List[tuple], limit: int) -> List[tuple]:
+def _rank_with_heuristics(items: List[Article], limit: int) -> List[Article]:
     scored = []
-    for ts, title, *rest in items:
-        score = _score_title(title)
-        scored.append((score, ts, (ts, title, *rest)))
+    for item in items:
+        score = _score_title(item.title)
+        scored.append((score, item.ts, item))
 
     # Sort by score desc, then by time desc to keep freshness
     scored.sort(key=lambda x: (x[0], x[1]), reverse=True)
     return [entry[2] for entry in scored[:limit]]
 
-def _summarize_with_gemini(prompt: str) -> str:
+_GEMINI_SETUP_LOCK = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _configure_gemini(api_key: str):
+    genai.configure(api_key=api_key)
+
+def _get_gemini_model(api_key: str, system_instruction: str = None):
+    # Summary batches call this from several threads; serialize so a model
+    # (and its context cache) is built once instead of racing the lru_cache
+    with _GEMINI_SETUP_LOCK:
+        return _build_gemini_model(api_key, system_instruction)
+
+@lru_cache(maxsize=8)
+def _build_gemini_model(api_key: str, system_instruction: str = None):
+    # Configure the SDK once per key, then build one wrapper per instruction set
+    _configure_gemini(api_key)
+
+    if system_instruction and GEMINI_CONTEXT_CACHE:
+        try:
+            from google.generativeai import caching
+
+            cached = caching.CachedContent.create(
+                model=f"models/{GEMINI_MODEL_NAME}",
+                system_instruction=system_instruction,
+                ttl=GEMINI_CONTEXT_CACHE_TTL,
+            )
+            return genai.GenerativeModel.from_cached_content(cached_content=cached)
+        except Exception as e:
+            print(f"[Gemini] Context cache unavailable ({e}), sending instructions inline.")
+
+    return genai.GenerativeModel(GEMINI_MODEL_NAME, system_instruction=system_instruction)
+
+@lru_cache(maxsize=1)
+def _get_grok_client(api_key: str):
+    return Groq(api_key=api_key)
+
+def _summarize_with_gemini(prompt: str, system_instruction: str = None) -> str:
     key = os.environ.get("GEMINI_API_KEY")
     if not key:
         raise RuntimeError("GEMINI_API_KEY is not set.")
     
-    genai.configure(api_key=key)
-    model = genai.GenerativeModel("gemini-2.5-flash-preview-09-2025")
+    model = _get_gemini_model(key, system_instruction)
     
     last_exc = None
     for attempt in range(3):
         try:
-            res = model.generate_content(prompt)
+            _GEMINI_LIMITER.acquire()
+            with _LLM_SLOTS:
+                res = model.generate_content(prompt)
             return res.text.strip()
         except exceptions.ResourceExhausted as exc:
             last_exc = exc
             if attempt == 2: raise
             delay = _extract_retry_delay(exc)
             print(f"[Gemini] Quota exceeded, retrying in {delay}s...")
-            time.sleep(delay)
+            # Concurrent summaries share the quota; the next acquire() waits
+            _GEMINI_LIMITER.defer(delay)
         except exceptions.GoogleAPICallError as exc:
             last_exc = exc
             if attempt == 2: raise
@@ -108,7 +324,7 @@ def _summarize_with_gemini(prompt: str) -> str:
             
     raise last_exc if last_exc else RuntimeError("Gemini summarization failed")
 
-def _summarize_with_grok(prompt: str) -> str:
+def _summarize_with_grok(prompt: str, system_instruction: str = None) -> str:
     api_key = os.getenv("GROK_API_KEY")
     if not api_key:
         raise RuntimeError("GROK_API_KEY is not set.")
@@ -116,85 +332,190 @@ def _summarize_with_grok(prompt: str) -> str:
     if not Groq:
         raise ImportError("Groq library not installed properly.")
 
-    client = Groq(api_key=api_key)
-    model = os.getenv("GROK_MODEL", "llama-3.3-70b-versatile")
+    client = _get_grok_client(api_key)
     
-    res = client.chat.completions.create(
-        messages=[{"role": "user", "content": prompt}],
-        model=model,
-    )
+    messages = [{"role": "user", "content": prompt}]
+    if system_instruction:
+        messages.insert(0, {"role": "system", "content": system_instruction})
+
+    _GROK_LIMITER.acquire()
+    with _LLM_SLOTS:
+        res = client.chat.completions.create(
+            messages=messages,
+            model=GROK_MODEL_NAME,
+        )
     return res.choices[0].message.content.strip()
 
-def summarize_article(text: str, title: str, display_name: str) -> str:
+def build_prompt_payload(content: str, link: str) -> str:
+    """Normalize feed content once into the bounded text sent to the summarizer.
+
+    Feed HTML is reduced to text and whitespace collapsed before truncating,
+    so the token budget is spent on words rather than markup; the URL line
+    is appended after truncation so it is never cut off.
+    """
+    body = html_to_text(content, MAX_PROMPT_CONTENT_CHARS)
+    return body + f"\n\nURL: {link}"
+
+def _summary_cache_key(text: str, title: str, display_name: str, link: str = None) -> str:
+    # Key on the article URL when known so small feed-body edits between runs
+    # still hit; fall back to the full prompt text otherwise
+    raw = f"{link or text}|{title}|{display_name}|{SUMMARY_PROMPT_VERSION}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def summarize_article(text: str, title: str, display_name: str, cache=None, link: str = None) -> str:
+    cache_key = None
+    if cache is not None:
+        cache_key = _summary_cache_key(text, title, display_name, link)
+        cached = cache.get(cache_key)
+        if cached:
+            return cached
+
     # Check if any API key is available
     if not os.environ.get("GEMINI_API_KEY") and not os.environ.get("GROK_API_KEY"):
         return "API Key 미설정으로 AI 요약 생략"
 
-    # === 개선된 프롬프트 적용 ===
-    prompt = f"""
-너는 스타트업 대표의 의사결정을 지원하는 전문 뉴스 분석 에이전트임.
-아래 규칙에 따라 {display_name} 관련 기사를 "한글"로 구조화해 요약할 것.
+    system_instruction = SUMMARY_SYSTEM_TEMPLATE.format(display_name=display_name)
+    prompt = SUMMARY_INPUT_TEMPLATE.format(title=title, text=text)
 
-[요약 규칙]
-1. 기사의 핵심을 육하원칙(누가·언제·어디·무엇·왜·어떻게)에 따라 3~4줄로 요약할 것.
-2. 배경, 조건/제약, 수치·데이터(금액·비율·규모·일정 등)를 포함할 것.
-3. 중요한 문맥 2~3개는 반드시 **굵게** 표시할 것.
-4. 모든 문장은 명사형 종결(~함, ~임, ~되었음 등)으로 끝낼 것.
-5. 제목이 영문일 경우, 최상단에 반드시 한글 번역 제목을 1줄로 제시할 것.
+    try:
+        summary = _summarize_with_grok(prompt, system_instruction)
+    except Exception:
+        summary = _summarize_with_gemini(prompt, system_instruction)
 
-[출력 형식]
-[제목]
-· (영문 제목일 경우) 한글 번역 1줄
+    if cache is not None and summary:
+        cache.set(cache_key, summary)
+    return summary
 
-[요약]
-· 핵심 3~4줄
-· 가장 중요한 문맥은 **굵게**
 
-[의미]
-· 산업구조/경쟁/시장기회 또는 리스크 중 가장 핵심 1줄로 요약
+def _parse_summary_array(reply: str, count: int):
+    """First JSON array of ``count`` strings in a model reply, or None.
 
-아래 원문을 요약할 것.
+    Decoding is tried from each "[" in turn, so bracketed labels such as
+    "[요약]" in prose before the array are skipped.
+    """
+    start = reply.find("[")
+    while start != -1:
+        try:
+            value, _end = _LENIENT_JSON.raw_decode(reply, start)
+        except ValueError:
+            value = None
+        if isinstance(value, list) and len(value) == count and all(isinstance(v, str) for v in value):
+            return value
+        start = reply.find("[", start + 1)
+    return None
 
-제목: {title}
+def _summarize_batch(batch: List[tuple], display_name: str) -> List[str]:
+    """Summarize several (text, title, link) items in one request.
 
-내용:
-{text[:2000]}
-"""
+    Returns None when the reply is not a JSON array with one string per item.
+    """
+    system_instruction = SUMMARY_BATCH_SYSTEM_TEMPLATE.format(display_name=display_name)
+    articles = "".join(
+        SUMMARY_BATCH_ARTICLE_TEMPLATE.format(index=idx, title=title, text=text)
+        for idx, (text, title, _link) in enumerate(batch, start=1)
+    )
+    prompt = SUMMARY_BATCH_INPUT_TEMPLATE.format(count=len(batch), articles=articles)
 
     try:
-        return _summarize_with_grok(prompt)
+        resp = _summarize_with_grok(prompt, system_instruction)
     except Exception:
-        return _summarize_with_gemini(prompt)
+        resp = _summarize_with_gemini(prompt, system_instruction)
 
+    summaries = _parse_summary_array(resp, len(batch))
+    if summaries is None or not all(summary.strip() for summary in summaries):
+        return None
+    return [summary.strip() for summary in summaries]
 
-def _rank_with_llm(candidates: List[tuple], limit: int) -> List[tuple]:
-    candidates_text = "\n".join([f"{idx}. {t[1]}" for idx, t in enumerate(candidates)])
+def summarize_articles(items: List[tuple], display_name: str, cache=None, max_workers: int = 1) -> List[str]:
+    """Summarize (text, title, link) items, several per LLM request.
 
-    prompt = f"""
-다음은 다양한 테크 뉴스 기사들의 제목 리스트야.
-이 중에서 오늘날짜 뉴스레터에 포함시킬 가장 '중요하고 의미 있는' 기사 {limit}개를 골라줘.
+    Cached summaries are reused; the rest are grouped into batches of
+    SUMMARY_BATCH_SIZE. A batch whose reply cannot be parsed falls back to
+    one summarize_article call per item. Returns summaries in input order,
+    with "요약 실패" for items that could not be summarized.
+    """
+    summaries = [None] * len(items)
+    pending = []
+    for idx, (text, title, link) in enumerate(items):
+        cached = cache.get(_summary_cache_key(text, title, display_name, link)) if cache is not None else None
+        if cached:
+            summaries[idx] = cached
+        else:
+            pending.append(idx)
+
+    if not pending:
+        return summaries
 
-중요도 판단 기준:
-1. 주요 기술 기업(OpenAI, Google, Apple, 삼성, LG 등)의 새로운 제품/모델 출시
-2. AI 분야의 획기적인 연구 성과나 논문
-3. 업계의 큰 인수합병이나 정책 변화
-4. 단순 튜토리얼이나 홍보성 기사는 제외
+    if not os.environ.get("GEMINI_API_KEY") and not os.environ.get("GROK_API_KEY"):
+        for idx in pending:
+            summaries[idx] = "API Key 미설정으로 AI 요약 생략"
+        return summaries
 
-응답 형식:
-- 가장 중요하다고 생각되는 기사의 '인덱스 번호'만 쉼표(,)로 나열해줘.
-- 예: 1, 5, 10, 3, 2
+    batches = [pending[i:i + SUMMARY_BATCH_SIZE] for i in range(0, len(pending), SUMMARY_BATCH_SIZE)]
 
-[기사 목록]
-{candidates_text}
-"""
+    def run_batch(batch_indices):
+        """Fill summaries for one batch; returns the indices left to retry singly."""
+        batch = [items[idx] for idx in batch_indices]
+        if len(batch) < 2:
+            return batch_indices
 
-    try:
         try:
-            resp = _summarize_with_grok(prompt)
-        except Exception:
-            resp = _summarize_with_gemini(prompt)
+            results = _summarize_batch(batch, display_name)
+        except Exception as e:
+            print(f"[LLM] Batch summarization failed ({e}), summarizing one by one.")
+            return batch_indices
+        if results is None:
+            print("[LLM] Batch reply unusable, summarizing one by one.")
+            return batch_indices
+
+        for idx, (text, title, link), summary in zip(batch_indices, batch, results):
+            summaries[idx] = summary
+            if cache is not None:
+                cache.set(_summary_cache_key(text, title, display_name, link), summary)
+        return []
+
+    def run_single(idx):
+        text, title, link = items[idx]
+        try:
+            summaries[idx] = summarize_article(text, title, display_name, cache=cache, link=link)
+        except Exception as e:
+            print(f"[LLM] Summarization error: {e}")
+            summaries[idx] = "요약 실패"
 
-        matches = re.findall(r"\d+", resp)
+    # Batches are independent network waits; items from failed batches are
+    # then retried one per request, also concurrently
+    workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        retry = [idx for left in ex.map(run_batch, batches) for idx in left]
+        list(ex.map(run_single, retry))
+
+    return summaries
+
+def _response_cache_key(prompt: str) -> str:
+    # Either provider may answer, so both model ids are part of the key
+    raw = f"{GROK_MODEL_NAME}|{GEMINI_MODEL_NAME}|{prompt}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def _rank_with_llm(candidates: List[Article], limit: int, cache=None) -> List[Article]:
+    candidates_text = "\n".join([f"{idx}. {t.title}" for idx, t in enumerate(candidates)])
+
+    prompt = RANKING_PROMPT_TEMPLATE.format(limit=limit, candidates_text=candidates_text)
+
+    # Unchanged feeds (HTTP 304) yield the same candidate list, and so the
+    # same prompt; reuse the earlier ranking reply for it
+    cache_key = _response_cache_key(prompt) if cache is not None else None
+    resp = cache.get(cache_key) if cache is not None else None
+
+    try:
+        if not resp:
+            try:
+                resp = _summarize_with_grok(prompt)
+            except Exception:
+                resp = _summarize_with_gemini(prompt)
+            if cache is not None and resp:
+                cache.set(cache_key, resp)
+
+        matches = _DIGITS_RE.findall(resp)
         ranked_indices = [int(m) for m in matches]
 
     except Exception as e:
@@ -219,15 +540,15 @@ def _rank_with_llm(candidates: List[tuple], limit: int) -> List[tuple]:
 
     return selected[:limit]
 
-def rank_items_with_ai(items: List[tuple], limit: int) -> List[tuple]:
+def rank_items_with_ai(items: List[Article], limit: int, cache=None) -> List[Article]:
     if not items:
         return []
 
     strategy = os.getenv("AI_RANKING_STRATEGY", "heuristic").lower()
     max_candidates = int(os.getenv("AI_RANKING_CANDIDATES", "40"))
 
-    # Sort by time desc first, take top N
-    candidates = sorted(items, key=lambda x: x[0], reverse=True)[:max_candidates]
+    # Newest N by time, without sorting the whole list
+    candidates = heapq.nlargest(max_candidates, items, key=lambda x: x.ts)
 
     # If strategy is not explicitly LLM-based, use heuristics only
     if strategy not in ("llm", "hybrid"):
@@ -239,7 +560,7 @@ def rank_items_with_ai(items: List[tuple], limit: int) -> List[tuple]:
             print("[LLM] API Key missing, using heuristic ranking instead.")
         return _rank_with_heuristics(candidates, limit)
 
-    llm_ranked = _rank_with_llm(candidates, limit)
+    llm_ranked = _rank_with_llm(candidates, limit, cache=cache)
 
     # If LLM failed or empty, fall back to heuristics
     if not llm_ranked:
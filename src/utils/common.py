@@ -1,7 +1,9 @@
 import re
 import datetime
 import time
-from urllib.parse import urlparse
+import threading
+from html import escape, unescape
+from urllib.parse import urljoin, urlparse
 from functools import lru_cache
 
 try:
@@ -11,19 +13,32 @@ except ImportError:
 
 HIGHLIGHT_COLOR = "#E6F8D7"
 
+# Patterns used on every summary line; compiled once at import
+_BULLET_RE = re.compile(r"^[•□\-]\s*")
+_SECTION_RE = re.compile(r"\[?(제목|요약|의미)\]?")
+_MEANING_RE = re.compile(r"\[?의미\]?")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_KOREAN_RE = re.compile(r"[가-힣]")
+_IMG_RE = re.compile(r"<img[^>]+src=['\"]([^'\"]+)['\"]", re.IGNORECASE)
+# Lines carrying a URL or source attribution are dropped from summaries
+_DROP_LINE_RE = re.compile(r"URL:|출처\s*:|https?://")
+_DISALLOWED_CHARS_RE = re.compile(r"[^0-9A-Za-z가-힣\s.,;:!?\"'()\[\]{}<>@#%&*`~\-_/+|=]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?\u3002])\s+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+# "scheme://host" at the start of a link, up to the first "/", "?" or "#"
+_SCHEME_HOST_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://([^/?#]*)")
+
 HIGHLIGHT_STYLE = (
     f"background-color: {HIGHLIGHT_COLOR}; padding: 3px 5px; border-radius: 4px;"
 )
 
 
+_HIGHLIGHT_OPEN = f"<span class='highlight' style='{HIGHLIGHT_STYLE}'>"
+
+
 def _wrap_highlight(text: str) -> str:
-    return (
-        "<span class='highlight' style='"
-        + HIGHLIGHT_STYLE
-        + "'>"
-        + text
-        + "</span>"
-    )
+    return f"{_HIGHLIGHT_OPEN}{text}</span>"
 
 
 def markdown_bold_to_highlight(html_text: str) -> str:
@@ -45,21 +60,22 @@ def markdown_bold_to_highlight(html_text: str) -> str:
         if not cleaned:
             continue
 
-        cleaned = re.sub(r"^[•□\-]\s*", "", cleaned)
+        if cleaned[0] in "•□-":
+            cleaned = _BULLET_RE.sub("", cleaned)
 
-        section_match = re.fullmatch(r"\[?(제목|요약|의미)\]?", cleaned)
+        # Section labels are bare "[요약]"-style lines of at most four characters
+        section_match = _SECTION_RE.fullmatch(cleaned) if len(cleaned) <= 4 else None
         if section_match:
             current_section = section_match.group(1)
             continue
 
+        # Most lines carry no bold markers; skip the regex for them. A template
+        # replacement keeps the substitution in C (no per-match callback).
         is_important = False
-
-        def strip_bold(match):
-            nonlocal is_important
-            is_important = True
-            return match.group(1)
-
-        converted = re.sub(r"\*\*(.+?)\*\*", strip_bold, cleaned)
+        converted = cleaned
+        if "**" in cleaned:
+            converted, bold_count = _BOLD_RE.subn(r"\1", cleaned)
+            is_important = bold_count > 0
 
         target_list = meaning_lines if current_section == "의미" else main_lines
         target_list.append((converted, is_important))
@@ -75,112 +91,243 @@ def markdown_bold_to_highlight(html_text: str) -> str:
         nonlocal highlighted_chars
         rendered = []
         for text, is_important in lines:
+            # Summary lines are plain text; escape them once before adding markup
+            escaped = escape(text, quote=False)
             if is_important and highlighted_chars + len(text) <= highlight_budget:
-                rendered.append(_wrap_highlight(text))
+                rendered.append(_wrap_highlight(escaped))
                 highlighted_chars += len(text)
             else:
-                rendered.append(text)
+                rendered.append(escaped)
         return rendered
 
     rendered_main = render_lines(main_lines)
     rendered_meaning = render_lines(meaning_lines)
 
+    # One join per block: the tags between lines are the join separator
     main_html = ""
     if rendered_main:
-        items = [f"<li>{line}</li>" for line in rendered_main]
-        main_html = "<ul class='summary-list'>" + "".join(items) + "</ul>"
+        main_html = f"<ul class='summary-list'><li>{'</li><li>'.join(rendered_main)}</li></ul>"
 
     meaning_html = ""
     if rendered_meaning:
-        meaning_items = "".join(
-            f"<div class='meaning-line'>{line}</div>" for line in rendered_meaning
-        )
-        meaning_html = f"<div class='meaning-box'>{meaning_items}</div>"
+        meaning_lines_html = "</div><div class='meaning-line'>".join(rendered_meaning)
+        meaning_html = f"<div class='meaning-box'><div class='meaning-line'>{meaning_lines_html}</div></div>"
 
     return main_html + meaning_html
 
+# Titles are checked both in the batch translation and again per title
+@lru_cache(maxsize=1024)
 def contains_korean(text: str) -> bool:
-    return bool(re.search(r"[가-힣]", text))
+    return bool(_KOREAN_RE.search(text))
+
+# deep_translator stores the text being translated on the instance before
+# sending it, so one translator shared by concurrently running categories
+# could send one thread's titles under another's call; keep one per thread
+_translator_local = threading.local()
 
-_translator = None
+def _get_translator():
+    translator = getattr(_translator_local, "translator", None)
+    if translator is None:
+        translator = GoogleTranslator(source="auto", target="ko")
+        _translator_local.translator = translator
+    return translator
 
 @lru_cache(maxsize=256)
-def translate_title_to_korean(title: str) -> str:
-    """Translate English titles to Korean for display. Fallback to original on failure."""
+def _translate_remote(title: str) -> str:
+    """One GoogleTranslator round-trip; returns "" when translation fails."""
+    if GoogleTranslator is None:
+        return ""
+
+    try:
+        return _get_translator().translate(title) or ""
+    except Exception:
+        return ""
+
+def translate_title_to_korean(title: str, cache=None) -> str:
+    """Translate English titles to Korean for display. Fallback to original on failure.
+
+    ``cache`` is an optional persistent store (see TitleCache) consulted before
+    calling the translator; only successful translations are written to it.
+    """
     if not title or contains_korean(title):
         return title
-    
-    if GoogleTranslator is None:
+
+    if cache is not None:
+        cached = cache.get(title)
+        if cached:
+            return cached
+
+    result = _translate_remote(title)
+    if not result:
         return title
 
-    global _translator
-    if _translator is None:
-        _translator = GoogleTranslator(source="auto", target="ko")
+    if cache is not None:
+        cache.set(title, result)
+    return result
+
+# GoogleTranslator rejects requests over 5000 characters
+_TRANSLATE_BATCH_CHARS = 4500
+
+def _translate_lines(titles) -> list:
+    """Translate several titles in one request by joining them with newlines."""
+    if GoogleTranslator is None:
+        return []
 
     try:
-        result = _translator.translate(title)
-        return result if result else title
+        result = _get_translator().translate("\n".join(titles)) or ""
     except Exception:
-        pass
-    return title
+        return []
+
+    lines = [line.strip() for line in result.split("\n")]
+    # The split is only trustworthy if every title kept its own line
+    return lines if len(lines) == len(titles) else []
+
+def translate_titles_to_korean(titles, cache=None) -> dict:
+    """Translate a batch of titles, returning {original: translated}.
+
+    deep_translator's translate_batch still sends one request per string, so
+    pending titles are joined into as few requests as the size limit allows.
+    Chunks whose line count does not survive translation fall back to
+    per-title calls. Successful translations are written to ``cache``.
+    """
+    translated = {}
+    pending = []
+    for title in titles:
+        if not title or title in translated or contains_korean(title):
+            continue
+        cached = cache.get(title) if cache is not None else None
+        if cached:
+            translated[title] = cached
+        elif title not in pending and "\n" not in title:
+            pending.append(title)
+
+    chunk, size = [], 0
+    chunks = []
+    for title in pending:
+        if chunk and size + len(title) + 1 > _TRANSLATE_BATCH_CHARS:
+            chunks.append(chunk)
+            chunk, size = [], 0
+        chunk.append(title)
+        size += len(title) + 1
+    if chunk:
+        chunks.append(chunk)
+
+    for chunk in chunks:
+        lines = _translate_lines(chunk) if len(chunk) > 1 else []
+        if not lines:
+            lines = [_translate_remote(title) for title in chunk]
+        for title, result in zip(chunk, lines):
+            if not result:
+                continue
+            translated[title] = result
+            if cache is not None:
+                cache.set(title, result)
+
+    return translated
+
+@lru_cache(maxsize=1024)
+def _format_minute(minute: int) -> str:
+    try:
+        return datetime.datetime.fromtimestamp(minute * 60).strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        return "발행 시각 정보 없음"
 
 def format_timestamp(ts: float) -> str:
     if not ts:
         return "발행 시각 정보 없음"
+    # The display has minute resolution, so memoize per whole minute
     try:
-        return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+        return _format_minute(int(ts) // 60)
     except Exception:
         return "발행 시각 정보 없음"
 
+def _netloc(link: str) -> str:
+    # Slice the host out of "scheme://host/..." directly; anything else (no
+    # scheme, or "://" only inside a query or fragment) goes through urlparse
+    match = _SCHEME_HOST_RE.match(link)
+    if match:
+        return match.group(1)
+    return urlparse(link).netloc
+
 def extract_source_name(entry, link: str) -> str:
-    source_title = getattr(entry, "source", None)
+    source_title = entry.get("source")
     if source_title:
-        title_val = getattr(source_title, "title", None)
+        title_val = source_title.get("title")
         if title_val:
             return title_val
     
-    netloc = urlparse(link or "").netloc
+    netloc = _netloc(link or "")
     if netloc.startswith("www."):
         netloc = netloc[4:]
     return netloc or "출처 미상"
 
-def extract_image_url(entry) -> str:
-    media_content = getattr(entry, "media_content", None) or []
-    if media_content:
-        first = media_content[0]
-        if isinstance(first, dict) and first.get("url"):
-            return first["url"]
-
-    media_thumbnail = getattr(entry, "media_thumbnail", None) or []
-    if media_thumbnail:
-        thumb = media_thumbnail[0]
-        if isinstance(thumb, dict) and thumb.get("url"):
-            return thumb["url"]
-
-    image_link = getattr(entry, "image", None)
-    if isinstance(image_link, dict) and image_link.get("href"):
-        return image_link["href"]
-
-    def extract_from_html(html_text: str) -> str:
-        if not html_text:
-            return ""
-        match = re.search(r"<img[^>]+src=['\"]([^'\"]+)['\"]", html_text, re.IGNORECASE)
-        return match.group(1) if match else ""
-
-    contents = getattr(entry, "content", None) or []
-    for content in contents:
+def _first_url(items, key: str = "url") -> str:
+    if items:
+        first = items[0]
+        if isinstance(first, dict):
+            return first.get(key) or ""
+    return ""
+
+def _image_from_html(html_text: str, base_link: str) -> str:
+    if not html_text:
+        return ""
+    match = _IMG_RE.search(html_text)
+    if not match:
+        return ""
+    # Feeds are parsed without relative-URI rewriting, so anchor the
+    # image to the article link here
+    return urljoin(base_link or "", match.group(1))
+
+def _image_from_media_content(entry) -> str:
+    return _first_url(entry.get("media_content"))
+
+def _image_from_media_thumbnail(entry) -> str:
+    return _first_url(entry.get("media_thumbnail"))
+
+def _image_from_image_link(entry) -> str:
+    image_link = entry.get("image")
+    if isinstance(image_link, dict):
+        return image_link.get("href") or ""
+    return ""
+
+def _image_from_content(entry) -> str:
+    link = entry.get("link", "")
+    for content in entry.get("content") or ():
         val = content.get("value", "") if isinstance(content, dict) else getattr(content, "value", "")
-        candidate = extract_from_html(val)
+        candidate = _image_from_html(val, link)
         if candidate:
             return candidate
+    return ""
 
-    summary_html = getattr(entry, "summary", "") or getattr(entry, "description", "")
-    html_candidate = extract_from_html(summary_html)
-    if html_candidate:
-        return html_candidate
+def _image_from_summary(entry) -> str:
+    summary_html = entry.get("summary", "") or entry.get("description", "")
+    return _image_from_html(summary_html, entry.get("link", ""))
+
+# Image sources in priority order; the cheap structured ones come first and
+# the HTML scans only run when they find nothing
+_IMAGE_SOURCES = (
+    _image_from_media_content,
+    _image_from_media_thumbnail,
+    _image_from_image_link,
+    _image_from_content,
+    _image_from_summary,
+)
 
+def extract_image_url(entry) -> str:
+    for source in _IMAGE_SOURCES:
+        url = source(entry)
+        if url:
+            return url
     return ""
 
+def html_to_text(html_text: str, max_chars: int) -> str:
+    """Plain text of a feed HTML snippet, whitespace collapsed, cut to ``max_chars``."""
+    # Markup-heavy bodies shrink a lot once tags are stripped, but 50KB feed
+    # summaries need not be scanned in full
+    raw = (html_text or "")[:max_chars * 8]
+    text = unescape(_HTML_TAG_RE.sub(" ", raw))
+    return " ".join(text.split())[:max_chars]
+
 def sanitize_summary(summary: str) -> str:
     cleaned_lines = []
     seen = set()
@@ -188,14 +335,10 @@ def sanitize_summary(summary: str) -> str:
         stripped = line.strip()
         if not stripped:
             continue
-        if "URL:" in stripped:
-            continue
-        if re.search(r"출처\s*:", stripped):
-            continue
-        if re.search(r"https?://", stripped):
+        if _DROP_LINE_RE.search(stripped):
             continue
-        cleaned = re.sub(r"[^0-9A-Za-z가-힣\s.,;:!?\"'()\[\]{}<>@#%&*`~\-_/+|=]", "", stripped)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
+        cleaned = _DISALLOWED_CHARS_RE.sub("", stripped)
+        cleaned = _WHITESPACE_RE.sub(" ", cleaned).strip()
         if not cleaned:
             continue
         if cleaned in seen:
@@ -216,7 +359,7 @@ def trim_summary_lines(summary: str, min_lines: int = 3, max_lines: int = 5) ->
 
     meaning_lines = []
     for idx, line in enumerate(lines):
-        if re.fullmatch(r"\[?의미\]?", line):
+        if _MEANING_RE.fullmatch(line):
             meaning_lines = lines[idx + 1 :]
             lines = lines[:idx]
             break
@@ -224,7 +367,7 @@ def trim_summary_lines(summary: str, min_lines: int = 3, max_lines: int = 5) ->
     if len(lines) < min_lines:
         # Break long sentences to meet the minimum line requirement
         combined = " ".join(lines) if lines else summary
-        sentences = re.split(r"(?<=[.!?\u3002])\s+", combined)
+        sentences = _SENTENCE_SPLIT_RE.split(combined)
         sentences = [s.strip() for s in sentences if s.strip()]
 
         for sentence in sentences:
@@ -242,9 +385,9 @@ def trim_summary_lines(summary: str, min_lines: int = 3, max_lines: int = 5) ->
     return "\n".join(trimmed)
 
 
-def shorten_korean_title(title: str, max_length: int = 40) -> str:
+def shorten_korean_title(title: str, max_length: int = 40, cache=None) -> str:
     """Translate English titles to Korean and trim them to under 40 chars."""
-    translated = translate_title_to_korean(title)
+    translated = translate_title_to_korean(title, cache=cache)
     translated = translated or title
 
     if len(translated) > max_length:
@@ -1,9 +1,55 @@
+import hashlib
 import json
 import os
 import re
+import time
 from difflib import SequenceMatcher
 from typing import List, Dict
 
+# Title normalization for similarity checks: keep only letters and digits
+_TITLE_STRIP_RE = re.compile(r"[^0-9A-Za-z가-힣]")
+
+# "살린" member filter: romanized proper-noun mention, and verb-like uses
+_SALRIN_ROMANIZED_RE = re.compile(r"\bSALIN\b", re.IGNORECASE)
+_SALRIN_VERB_PATTERNS = [
+    # Object + 살린 + noun (e.g., "김수용 살린 김숙", "생명 살린 의용소방대원")
+    re.compile(r"[가-힣A-Za-z0-9][\)\]\"'’”]?\s*살린\s+[가-힣0-9]"),
+    # Past-tense clause tails such as "살린 뒤", "살린 후", "살린 적"
+    re.compile(r"살린\s+(뒤|후|채|적|줄|상황|점|것)"),
+]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """Serialize to JSON text (non-ASCII kept as-is), using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def write_text_atomic(path: str, content: str):
+    """
+    Write a whole file in one call through a temp file and os.replace, so an
+    interrupted run never leaves a half-written page or data file behind.
+    """
+    # Encode once up front; a buffered binary file passes a payload this
+    # large straight to the OS instead of encoding it chunk by chunk
+    data = content.encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
 class MemberStorage:
     def __init__(self, data_dir="data/members"):
         self.data_dir = data_dir
@@ -18,7 +64,7 @@ class MemberStorage:
             return []
         try:
             with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+                return json_loads(f.read())
         except Exception as e:
             print(f"[Storage] Failed to load {member_id}: {e}")
             return []
@@ -41,7 +87,7 @@ class MemberStorage:
         now_ts = datetime.datetime.now().timestamp()
 
         def normalize(s):
-            cleaned = re.sub(r"[^0-9A-Za-z가-힣]", "", s)
+            cleaned = _TITLE_STRIP_RE.sub("", s)
             return cleaned.lower()
 
         def is_similar_title(norm_title: str, seen_titles: List[str], threshold: float = 0.9) -> bool:
@@ -72,18 +118,11 @@ class MemberStorage:
                 return False
 
             # Accept explicit romanization mentions as a proper noun.
-            if re.search(r"\bSALIN\b", title, flags=re.IGNORECASE):
+            if _SALRIN_ROMANIZED_RE.search(title):
                 return True
 
-            verb_like_patterns = [
-                # Object + 살린 + noun (e.g., "김수용 살린 김숙", "생명 살린 의용소방대원")
-                r"[가-힣A-Za-z0-9][\)\]\"'’”]?\s*살린\s+[가-힣0-9]",
-                # Past-tense clause tails such as "살린 뒤", "살린 후", "살린 적"
-                r"살린\s+(뒤|후|채|적|줄|상황|점|것)",
-            ]
-
-            for pat in verb_like_patterns:
-                if re.search(pat, title):
+            for pat in _SALRIN_VERB_PATTERNS:
+                if pat.search(title):
                     return False
 
             return True
@@ -122,8 +161,7 @@ class MemberStorage:
         merged = enforce_daily_limit(merged)
 
         try:
-            with open(self._get_path(member_id), "w", encoding="utf-8") as f:
-                json.dump(merged, f, ensure_ascii=False, indent=2)
+            write_text_atomic(self._get_path(member_id), json_dumps(merged, indent=True))
         except Exception as e:
             print(f"[Storage] Failed to save {member_id}: {e}")
 
@@ -140,7 +178,7 @@ class GovStorage:
             return []
         try:
             with open(self.data_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+                return json_loads(f.read())
         except Exception as e:
             print(f"[Storage] Failed to load gov announcements: {e}")
             return []
@@ -153,7 +191,7 @@ class GovStorage:
         """
 
         def normalize(text: str) -> str:
-            cleaned = re.sub(r"[^0-9A-Za-z가-힣]", "", text or "")
+            cleaned = _TITLE_STRIP_RE.sub("", text or "")
             return cleaned.lower()
 
         def is_similar_title(norm_title: str, seen_titles: List[str], threshold: float = 0.9) -> bool:
@@ -190,9 +228,170 @@ class GovStorage:
         merged = merge_items(existing_items, new_items)
 
         try:
-            with open(self.data_path, "w", encoding="utf-8") as f:
-                json.dump(merged, f, ensure_ascii=False, indent=2)
+            write_text_atomic(self.data_path, json_dumps(merged, indent=True))
         except Exception as e:
             print(f"[Storage] Failed to save gov announcements: {e}")
 
         return merged
+
+
+class FeedCache:
+    """
+    Remembers each feed's HTTP validators (ETag / Last-Modified) together with
+    the entries from its last full download, so that an unchanged feed can be
+    answered with a conditional GET (HTTP 304) instead of a re-download.
+    Feeds not checked for ``ttl_days`` (e.g. removed from the config) are
+    dropped on load.
+    """
+
+    def __init__(self, data_path: str = "data/cache/feeds.json", ttl_days: int = 30):
+        self.data_path = data_path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
+        self.feeds = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.data_path):
+            return {}
+        try:
+            with open(self.data_path, "r", encoding="utf-8") as f:
+                feeds = json_loads(f.read())
+        except Exception as e:
+            print(f"[Storage] Failed to load feed cache: {e}")
+            return {}
+
+        cutoff = time.time() - self.ttl_seconds
+        return {url: state for url, state in feeds.items() if state.get("checked_at", 0) >= cutoff}
+
+    def get(self, feed_url: str) -> Dict:
+        return self.feeds.get(feed_url, {})
+
+    def update(self, feed_url: str, state: Dict):
+        self.feeds[feed_url] = state
+
+    def save(self):
+        try:
+            write_text_atomic(self.data_path, json_dumps(self.feeds))
+        except Exception as e:
+            print(f"[Storage] Failed to save feed cache: {e}")
+
+
+class SummaryCache:
+    """
+    Persistent LLM reply cache. Summaries are keyed by a hash of the article
+    link, title and prompt version, ranking replies by a hash of the model
+    ids and prompt, so repeated work across feeds or runs is not re-sent.
+    Entries older than ``ttl_days`` are swept on load.
+    """
+
+    def __init__(self, data_path: str = "data/cache/summaries.json", ttl_days: int = 30):
+        self.data_path = data_path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
+        self.entries = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.data_path):
+            return {}
+        try:
+            with open(self.data_path, "r", encoding="utf-8") as f:
+                entries = json_loads(f.read())
+        except Exception as e:
+            print(f"[Storage] Failed to load summary cache: {e}")
+            return {}
+
+        cutoff = time.time() - self.ttl_seconds
+        return {
+            key: entry for key, entry in entries.items()
+            if isinstance(entry, dict) and entry.get("created_at", 0) >= cutoff
+        }
+
+    def get(self, key: str):
+        entry = self.entries.get(key)
+        return entry["summary"] if entry else None
+
+    def set(self, key: str, summary: str):
+        self.entries[key] = {"summary": summary, "created_at": int(time.time())}
+
+    def save(self):
+        try:
+            write_text_atomic(self.data_path, json_dumps(self.entries, indent=True))
+        except Exception as e:
+            print(f"[Storage] Failed to save summary cache: {e}")
+
+
+class TitleCache:
+    """
+    Persistent store of Korean title translations keyed by an md5 of the
+    source title, so titles seen in earlier runs skip the translator call.
+    Entries older than ``ttl_days`` are swept on load.
+    """
+
+    def __init__(self, data_path: str = "data/cache/titles.json", ttl_days: int = 30):
+        self.data_path = data_path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
+        self.entries = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.data_path):
+            return {}
+        try:
+            with open(self.data_path, "r", encoding="utf-8") as f:
+                entries = json_loads(f.read())
+        except Exception as e:
+            print(f"[Storage] Failed to load title cache: {e}")
+            return {}
+
+        # Plain-string entries from before timestamps were stored are dropped too
+        cutoff = time.time() - self.ttl_seconds
+        return {
+            key: entry for key, entry in entries.items()
+            if isinstance(entry, dict) and entry.get("created_at", 0) >= cutoff
+        }
+
+    @staticmethod
+    def _key(title: str) -> str:
+        return hashlib.md5(title.encode("utf-8")).hexdigest()
+
+    def get(self, title: str):
+        entry = self.entries.get(self._key(title))
+        return entry["text"] if entry else None
+
+    def set(self, title: str, translated: str):
+        self.entries[self._key(title)] = {"text": translated, "created_at": int(time.time())}
+
+    def save(self):
+        try:
+            write_text_atomic(self.data_path, json_dumps(self.entries, indent=True))
+        except Exception as e:
+            print(f"[Storage] Failed to save title cache: {e}")
+
+
+class ArchiveIndex:
+    """
+    Manifest of a category's daily archive runs (newest first), letting the
+    archive index be updated incrementally instead of re-scanning the
+    archive directory on every run.
+    """
+
+    def __init__(self, category_key: str, data_dir: str = "data/archive"):
+        self.data_path = os.path.join(data_dir, f"{category_key}.json")
+        os.makedirs(data_dir, exist_ok=True)
+
+    def load(self):
+        """Return the stored entries, or None when no manifest exists yet."""
+        if not os.path.exists(self.data_path):
+            return None
+        try:
+            with open(self.data_path, "r", encoding="utf-8") as f:
+                return json_loads(f.read())
+        except Exception as e:
+            print(f"[Storage] Failed to load archive index {self.data_path}: {e}")
+            return None
+
+    def save(self, entries: List[Dict]):
+        try:
+            write_text_atomic(self.data_path, json_dumps(entries, indent=True))
+        except Exception as e:
+            print(f"[Storage] Failed to save archive index {self.data_path}: {e}")
@@ -1,56 +1,58 @@
 import os
-import glob
 from datetime import datetime, timedelta
 from collections import Counter
 import re
 from wordcloud import WordCloud
 from bs4 import BeautifulSoup
 
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_URL_RE = re.compile(r'http\S+')
+_WORD_RE = re.compile(r'[a-zA-Z0-9가-힣]+')
+
+def _extract_page_text(file_path):
+    """Text of one daily page's headings, paragraphs and list items (None if unreadable)."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), 'lxml')
+    except ValueError:
+        return None
+
+    # Extract text from headings and paragraphs
+    # Adjust selectors based on actual HTML structure if needed
+    # Usually h3 are titles in these generate files
+    return " ".join(tag.get_text() for tag in soup.find_all(['h3', 'p', 'li']))
+
 def extract_weekly_keywords(docs_dir="docs", days=7):
     """
     Extracts keywords from AI and XR daily summaries for the past `days` days.
     """
     cutoff_date = datetime.now() - timedelta(days=days)
-    text_content = ""
 
-    # Paths to search
-    # Assuming structure: docs/ai/daily/YYYY-MM-DD.html and docs/xr/daily/YYYY-MM-DD.html
-    # We will walk through the directory to be safe or glob specific patterns
-    
-    search_paths = [
-        os.path.join(docs_dir, "ai", "daily", "*.html"),
-        os.path.join(docs_dir, "xr", "daily", "*.html")
+    # Daily pages are named YYYY-MM-DD[_HHMMSS].html; ISO dates order as
+    # strings, so the name alone selects the pages dated after the cutoff day
+    cutoff_day = cutoff_date.strftime("%Y-%m-%d")
+    search_dirs = [
+        os.path.join(docs_dir, "ai", "daily"),
+        os.path.join(docs_dir, "xr", "daily")
     ]
     
-    files_processed = 0
+    recent_files = []
     
-    for pattern in search_paths:
-        for file_path in glob.glob(pattern):
-            # Extract date from filename
-            filename = os.path.basename(file_path)
-            # Expected format: YYYY-MM-DD.html or YYYY-MM-DD_HHMMSS.html
-            try:
-                # Remove extension
-                name_only = filename.replace(".html", "")
-                # Split by underscore if present to get date part
-                date_part = name_only.split("_")[0]
-                
-                file_date = datetime.strptime(date_part, "%Y-%m-%d")
-                
-                if file_date >= cutoff_date:
-                    # Process this file
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        soup = BeautifulSoup(f.read(), 'html.parser')
-                        
-                        # Extract text from headings and paragraphs
-                        # Adjust selectors based on actual HTML structure if needed
-                        # Usually h3 are titles in these generate files
-                        for tag in soup.find_all(['h3', 'p', 'li']):
-                            text_content += tag.get_text() + " "
-                    
-                    files_processed += 1
-            except ValueError:
-                continue # Skip files that don't match date format
+    for daily_dir in search_dirs:
+        if not os.path.isdir(daily_dir):
+            continue
+        with os.scandir(daily_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".html") or not entry.is_file():
+                    continue
+                date_part = entry.name[:-len(".html")].split("_")[0]
+                if _DATE_RE.fullmatch(date_part) and date_part > cutoff_day:
+                    recent_files.append(entry.path)
+
+    page_texts = [_extract_page_text(path) for path in recent_files]
+    page_texts = [text for text in page_texts if text is not None]
+    text_content = " ".join(page_texts)
+    files_processed = len(page_texts)
 
     print(f"Processed {files_processed} files for word cloud.")
     
@@ -64,10 +66,10 @@ def extract_weekly_keywords(docs_dir="docs", days=7):
     # Let's clean up punctuation.
     
     # Remove url like strings
-    text_content = re.sub(r'http\S+', '', text_content)
+    text_content = _URL_RE.sub('', text_content)
     
     # Extract words (Hangul and English)
-    words = re.findall(r'[a-zA-Z0-9가-힣]+', text_content)
+    words = _WORD_RE.findall(text_content)
     
     # Filter stopwords (very basic list)
     stopwords = {'이', '그', '저', '것', '수', '등', '를', '을', '의', '가', '이', '은', '는', '에', '와', '과', '한', '하다', '있다', '되다', 'to', 'and', 'of', 'the', 'in', 'a', 'for', 'on'}
@@ -0,0 +1,95 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from urllib.parse import urlparse
+
+from src.utils import common
+
+
+class _DictCache:
+    """In-memory stand-in for TitleCache."""
+
+    def __init__(self):
+        self.titles = {}
+
+    def get(self, title):
+        return self.titles.get(title)
+
+    def set(self, title, translated):
+        self.titles[title] = translated
+
+
+class TranslateTitlesConcurrencyTest(unittest.TestCase):
+    def setUp(self):
+        common._translate_remote.cache_clear()
+        common._translator_local = threading.local()
+
+    def tearDown(self):
+        common._translate_remote.cache_clear()
+        common._translator_local = threading.local()
+
+    def test_concurrent_categories_get_their_own_translations(self):
+        # Both category threads are inside translate() at the same time
+        in_flight = threading.Barrier(2)
+
+        class StatefulTranslator:
+            # Like deep_translator, keeps the request text on the instance
+            # while the request is in flight
+            def __init__(self, source, target):
+                self.text = None
+
+            def translate(self, text):
+                self.text = text
+                in_flight.wait(timeout=5)
+                return "\n".join(f"KO {line}" for line in self.text.split("\n"))
+
+        categories = {
+            "ai": ["OpenAI ships a new model", "GPU prices fall"],
+            "xr": ["Quest headset update", "Vision Pro sales"],
+        }
+
+        def run_category(titles):
+            cache = _DictCache()
+            return common.translate_titles_to_korean(titles, cache=cache), cache
+
+        with mock.patch.object(common, "GoogleTranslator", StatefulTranslator):
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                results = dict(zip(categories, ex.map(run_category, categories.values())))
+
+        for key, titles in categories.items():
+            translated, cache = results[key]
+            expected = {title: f"KO {title}" for title in titles}
+            self.assertEqual(translated, expected)
+            self.assertEqual(cache.titles, expected)
+
+
+class HtmlToTextTest(unittest.TestCase):
+    def test_strips_markup_and_bounds_length(self):
+        html_text = "<p>Body &amp; <b>text</b></p>\n<img src='x.png'>  more " + "<span>x</span>" * 5000
+        text = common.html_to_text(html_text, 20)
+        self.assertEqual(text, "Body & text more x x")
+        self.assertLessEqual(len(common.html_to_text(html_text, 2000)), 2000)
+
+
+class NetlocTest(unittest.TestCase):
+    def test_matches_urlparse(self):
+        links = [
+            "https://www.example.com/news/1",
+            "HTTP://Example.com:8080?x=1",
+            "https://example.com#top",
+            "https://user@example.com/a",
+            "example.com/r?u=https://x.com",
+            "/path?next=https://x.com/a",
+            "example.com#https://x.com",
+            "//cdn.example.com/img.png",
+            "mailto:someone@example.com",
+            "",
+        ]
+        for link in links:
+            with self.subTest(link=link):
+                self.assertEqual(common._netloc(link), urlparse(link).netloc)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from unittest import mock
+
+from src.generators import llm
+
+
+BATCH = [
+    ("OpenAI released a new reasoning model today.", "OpenAI ships a new model", "https://example.com/1"),
+    ("Nvidia cut prices across its GPU line.", "GPU prices fall", "https://example.com/2"),
+]
+
+FIRST_SUMMARY = """[제목]
+· 오픈AI, 새 추론 모델 공개
+
+[요약]
+· **오픈AI**가 새 추론 모델을 공개함
+· 수학·코딩 성능이 개선됨
+
+[의미]
+· 추론 모델 경쟁이 가속됨"""
+
+SECOND_SUMMARY = """[제목]
+· 엔비디아, GPU 가격 인하
+
+[요약]
+· **엔비디아**가 GPU 전 라인업 가격을 내림
+
+[의미]
+· 중소 연구실의 학습 비용 부담이 줄어듦"""
+
+# Prose with bracketed labels before the array, raw line breaks inside the
+# strings and a code fence around it, as models tend to reply
+MULTI_LINE_REPLY = f"""요청하신 형식([제목]/[요약]/[의미])에 맞춰 요약함.
+```json
+[
+  "{FIRST_SUMMARY}",
+  "{SECOND_SUMMARY}"
+]
+```"""
+
+
+class SummarizeBatchTest(unittest.TestCase):
+    def test_parses_multi_line_summaries(self):
+        with mock.patch.object(llm, "_summarize_with_grok", return_value=MULTI_LINE_REPLY):
+            summaries = llm._summarize_batch(BATCH, "AI")
+        self.assertEqual(summaries, [FIRST_SUMMARY, SECOND_SUMMARY])
+
+    def test_escaped_line_breaks(self):
+        reply = llm.json.dumps([FIRST_SUMMARY, SECOND_SUMMARY], ensure_ascii=False)
+        with mock.patch.object(llm, "_summarize_with_grok", return_value=reply):
+            summaries = llm._summarize_batch(BATCH, "AI")
+        self.assertEqual(summaries, [FIRST_SUMMARY, SECOND_SUMMARY])
+
+    def test_wrong_count_falls_back(self):
+        reply = f'["{FIRST_SUMMARY}"]'
+        with mock.patch.object(llm, "_summarize_with_grok", return_value=reply):
+            self.assertIsNone(llm._summarize_batch(BATCH, "AI"))
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_non_positive_rate_is_unlimited(self):
+        for rate in (0.0, -1.0, float("nan")):
+            with self.subTest(rate=rate):
+                limiter = llm.RateLimiter(rate, burst=1)
+                with mock.patch.object(llm.time, "sleep") as sleep:
+                    limiter.defer(30)
+                    for _ in range(3):
+                        limiter.acquire()
+                sleep.assert_not_called()
+
+    def test_env_float_falls_back_on_bad_values(self):
+        with mock.patch.dict(llm.os.environ, {"GROK_RPM": "fast"}):
+            self.assertEqual(llm._env_float("GROK_RPM", 30.0), 30.0)
+        with mock.patch.dict(llm.os.environ, {"GROK_RPM": "12.5"}):
+            self.assertEqual(llm._env_float("GROK_RPM", 30.0), 12.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
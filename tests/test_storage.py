@@ -0,0 +1,39 @@
+import os
+import tempfile
+import time
+import unittest
+
+from src.utils.storage import TitleCache
+
+
+class TitleCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "titles.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        cache = TitleCache(self.path)
+        cache.set("GPU prices fall", "GPU 가격 하락")
+        cache.save()
+        self.assertEqual(TitleCache(self.path).get("GPU prices fall"), "GPU 가격 하락")
+
+    def test_sweeps_expired_and_legacy_entries(self):
+        cache = TitleCache(self.path, ttl_days=30)
+        cache.set("fresh", "새 제목")
+        key = TitleCache._key
+        cache.entries[key("stale")] = {"text": "오래된 제목", "created_at": int(time.time()) - 31 * 24 * 60 * 60}
+        cache.entries[key("legacy")] = "예전 형식"
+        cache.save()
+
+        reloaded = TitleCache(self.path, ttl_days=30)
+        self.assertEqual(reloaded.get("fresh"), "새 제목")
+        self.assertIsNone(reloaded.get("stale"))
+        self.assertIsNone(reloaded.get("legacy"))
+        self.assertEqual(len(reloaded.entries), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()